@@ -1,17 +1,68 @@
 """Pi-hole API client for v6"""
 
-import requests
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import urllib3
 
 from config import PIHOLE_API, PIHOLE_PASSWORD
 from utils.logger import logger
 
+try:  # orjson parses several times faster; stdlib json is the fallback
+    import orjson
+
+    json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 class PiholeAPI:
     """Pi-hole API v6 client"""
 
+    # Seconds a response stays fresh, per endpoint path (query string ignored)
+    _TTL = {
+        "/stats/summary": 2,
+        "/history": 30,
+        "/stats/top_domains": 20,
+        "/stats/top_clients": 20,
+    }
+
+    # History buckets kept for the graph (4 hours at 5min intervals)
+    _HISTORY_BUCKETS = 48
+
+    # Seconds get_all waits for the concurrent fetches of one refresh
+    _REFRESH_TIMEOUT = 5
+
     def __init__(self) -> None:
         self.base_url = PIHOLE_API
         self.session_id: str | None = None
+        self._auth_lock = threading.Lock()
+        # endpoint -> (fetched at, parsed data, hash of the raw body)
+        self._cache: dict[str, tuple[float, dict, int]] = {}
+        # Last error logged per endpoint, so a dead Pi-hole isn't logged every poll
+        self._errors: dict[str, str] = {}
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pihole")
+        self._last_all: dict[str, dict] = {}
+        # Fetches that outlived a refresh; reused instead of resubmitted
+        self._pending: dict[str, Future[dict]] = {}
+
+        # Persistent pools keep the connection to Pi-hole alive between polls.
+        # Failures aren't retried, but redirects (e.g. http -> https) are
+        # followed like requests did, across hosts if need be
+        self._http = urllib3.PoolManager(
+            maxsize=4,
+            timeout=urllib3.Timeout(total=5),
+            retries=urllib3.Retry(
+                total=None, connect=0, read=0, status=0, other=0, redirect=3
+            ),
+        )
+        self._api_url = self.base_url.rstrip("/")
+        self._headers: dict[str, str] = {}
+
         self._authenticate()
 
     def _authenticate(self) -> None:
@@ -19,42 +70,72 @@ class PiholeAPI:
         if not PIHOLE_PASSWORD:
             return
         try:
-            response = requests.post(
-                f"{self.base_url}/auth",
-                json={"password": PIHOLE_PASSWORD},
-                timeout=5,
+            response = self._http.request(
+                "POST",
+                f"{self._api_url}/auth",
+                body=json.dumps({"password": PIHOLE_PASSWORD}),
+                headers={"Content-Type": "application/json"},
             )
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = json_loads(response.data)
                 self.session_id = data.get("session", {}).get("sid")
+                if self.session_id:
+                    self._headers = {"sid": self.session_id}
         except Exception as e:
-            logger.error(f"Auth error: {e}")
+            self._log_error("/auth", e)
 
-    def _get(self, endpoint: str) -> dict:
-        """Make authenticated GET request"""
-        headers: dict[str, str] = {}
-        if self.session_id:
-            headers["sid"] = self.session_id
+    def _log_error(self, endpoint: str, error: Exception | str) -> None:
+        """Log an API error only when it differs from the last one for endpoint"""
+        message = str(error)
+        if self._errors.get(endpoint) != message:
+            self._errors[endpoint] = message
+            logger.error("API error on %s: %s", endpoint, message)
 
-        try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                headers=headers,
-                timeout=5,
-            )
-            if response.status_code == 401:
+    def _reauthenticate(self, stale_sid: str | None) -> None:
+        """Re-authenticate once, even if several requests hit 401 together"""
+        with self._auth_lock:
+            if self.session_id == stale_sid:
                 self._authenticate()
-                if self.session_id:
-                    headers["sid"] = self.session_id
-                response = requests.get(
-                    f"{self.base_url}{endpoint}",
-                    headers=headers,
-                    timeout=5,
-                )
-            return response.json() if response.status_code == 200 else {}
+
+    def _get(
+        self, endpoint: str, extract: Callable[[dict], dict] | None = None
+    ) -> dict:
+        """Make authenticated GET request, served from cache while fresh.
+
+        extract, if given, reduces the parsed payload before it is cached so
+        large responses aren't kept in memory between polls.
+        """
+        ttl = self._TTL.get(endpoint.split("?", 1)[0], 0)
+        cached = self._cache.get(endpoint)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        try:
+            sid = self.session_id
+            url = f"{self._api_url}{endpoint}"
+            response = self._http.request("GET", url, headers=self._headers)
+            if response.status == 401:
+                self._reauthenticate(sid)
+                response = self._http.request("GET", url, headers=self._headers)
+            if response.status != 200:
+                self._log_error(endpoint, f"HTTP {response.status}")
+                return {}
+            # An identical body parses to the same data: skip json and extract
+            body_hash = hash(response.data)
+            if cached is not None and cached[2] == body_hash:
+                data = cached[1]
+            else:
+                data = json_loads(response.data)
+                if extract is not None:
+                    data = extract(data)
+            self._cache[endpoint] = (time.monotonic(), data, body_hash)
+            if self._errors.pop(endpoint, None) is not None:
+                logger.info("API recovered: %s", endpoint)
+            return data
         except Exception as e:
-            logger.error(f"API error: {e}")
-            return {}
+            self._log_error(endpoint, e)
+            # Keep showing the last known data while Pi-hole is unreachable
+            return cached[1] if cached is not None else {}
 
     def get_summary(self) -> dict:
         """Get Pi-hole summary statistics"""
@@ -74,25 +155,66 @@ class PiholeAPI:
 
     def get_overtime(self) -> dict:
         """Get query overtime data for graphs"""
-        return self._get("/history")
+        return self._get("/history", self._trim_history)
+
+    def _trim_history(self, data: dict) -> dict:
+        """Keep only the total/blocked counts of the buckets the graph shows"""
+        return {
+            "history": [
+                {"total": entry.get("total", 0), "blocked": entry.get("blocked", 0)}
+                for entry in data.get("history", ())[-self._HISTORY_BUCKETS :]
+            ]
+        }
 
     def get_top_blocked(self, count: int = 10) -> dict:
         """Get top blocked domains"""
         data = self._get(f"/stats/top_domains?blocked=true&count={count}")
 
         # Convert list to dict format
-        result = {}
-        for item in data.get("domains", []):
-            result[item.get("domain", "unknown")] = item.get("count", 0)
-        return {"domains": result}
+        return {
+            "domains": {
+                item.get("domain", "unknown"): item.get("count", 0)
+                for item in data.get("domains", ())
+            }
+        }
 
     def get_top_clients(self, count: int = 10) -> dict:
         """Get top clients"""
         data = self._get(f"/stats/top_clients?count={count}")
 
         # Convert list to dict format
-        result = {}
-        for item in data.get("clients", []):
-            name = item.get("name") or item.get("ip", "unknown")
-            result[name] = item.get("count", 0)
-        return {"clients": result}
+        return {
+            "clients": {
+                item.get("name") or item.get("ip", "unknown"): item.get("count", 0)
+                for item in data.get("clients", ())
+            }
+        }
+
+    def get_all(self) -> dict[str, dict]:
+        """Fetch summary, history and top lists concurrently in one refresh"""
+        fetchers = {
+            "summary": self.get_summary,
+            "overtime": self.get_overtime,
+            "blocked": self.get_top_blocked,
+            "clients": self.get_top_clients,
+        }
+        futures: dict[str, Future[dict]] = {}
+        for key, fetch in fetchers.items():
+            pending = self._pending.pop(key, None)
+            if pending is None:
+                pending = self._executor.submit(fetch)
+            futures[key] = pending
+        wait(futures.values(), timeout=self._REFRESH_TIMEOUT)
+
+        # A fetch still in flight keeps its previous result for this refresh
+        for key, future in futures.items():
+            if future.done():
+                self._last_all[key] = future.result()
+            else:
+                self._pending[key] = future
+        return {key: self._last_all.get(key, {}) for key in futures}
+
+    def close(self) -> None:
+        """Release worker threads and pooled connections"""
+        self._executor.shutdown(wait=False)
+        self._http.clear()
@@ -1,43 +1,71 @@
 """Configuration and constants for the Pi-hole dashboard"""
 
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 
 from __version__ import __version__
 from utils.logger import logger
 
-
-def _get_int_env(key: str, default: int, min_val: int = 0, max_val: int = 10000) -> int:
-    """Get integer from environment with validation"""
-    try:
-        value = int(os.environ.get(key, str(default)))
-    except ValueError:
-        logger.warning(f"Invalid {key} value, using default {default}")
-        return default
-
-    if value < min_val:
-        logger.warning(f"{key}={value} below minimum {min_val}, using {min_val}")
-        return min_val
-    if value > max_val:
-        logger.warning(f"{key}={value} exceeds maximum {max_val}, using {max_val}")
-        return max_val
-    return value
+# Environment lookup and accepted truthy values, bound once for all settings
+_env_get = os.environ.get
+_TRUE = frozenset(("true", "1", "yes", "on"))
+
+# Integer settings: (env key, default, min, max)
+_INT_SPECS: tuple[tuple[str, int, int, int], ...] = (
+    ("CUTIE_SCREEN_WIDTH", 480, 100, 1920),
+    ("CUTIE_SCREEN_HEIGHT", 320, 100, 1080),
+    ("CUTIE_FPS", 30, 1, 120),
+    ("CUTIE_API_INTERVAL", 5, 1, 3600),
+    ("CUTIE_SYSTEM_INTERVAL", 2, 1, 60),
+    ("CUTIE_SWIPE_THRESHOLD", 50, 10, 200),
+    ("CUTIE_SCREEN_TIMEOUT", 0, 0, 60),
+    ("CUTIE_BRIGHTNESS", 100, 10, 100),
+)
+
+
+def _parse_int_env(specs: tuple[tuple[str, int, int, int], ...]) -> dict[str, int]:
+    """Parse and clamp all integer settings from the environment in one pass"""
+    values: dict[str, int] = {}
+    rejected: list[tuple[str, str, int]] = []
+    for key, default, min_val, max_val in specs:
+        raw = _env_get(key)
+        value = default
+        if raw:
+            try:
+                value = int(raw)
+            except ValueError:
+                rejected.append((key, raw, default))
+        clamped = min_val if value < min_val else max_val if value > max_val else value
+        if clamped != value:
+            rejected.append((key, str(value), clamped))
+        values[key] = clamped
+
+    # Only entries that were invalid or out of range are reported
+    for key, raw, used in rejected:
+        logger.warning("Invalid %s=%s, using %s", key, raw, used)
+    return values
+
+
+_ints = _parse_int_env(_INT_SPECS)
 
 
 # Version
 VERSION = __version__
 
 # Display settings
-SCREEN_WIDTH = _get_int_env("CUTIE_SCREEN_WIDTH", 480, min_val=100, max_val=1920)
-SCREEN_HEIGHT = _get_int_env("CUTIE_SCREEN_HEIGHT", 320, min_val=100, max_val=1080)
-FPS = _get_int_env("CUTIE_FPS", 30, min_val=1, max_val=120)
+SCREEN_WIDTH = _ints["CUTIE_SCREEN_WIDTH"]
+SCREEN_HEIGHT = _ints["CUTIE_SCREEN_HEIGHT"]
+FPS = _ints["CUTIE_FPS"]
 
 # Pi-hole API settings
-PIHOLE_API = os.environ.get("CUTIE_PIHOLE_API", "http://localhost/api")
-PIHOLE_PASSWORD = os.environ.get("CUTIE_PIHOLE_PASSWORD", "")
+PIHOLE_API = _env_get("CUTIE_PIHOLE_API", "http://localhost/api")
+PIHOLE_PASSWORD = _env_get("CUTIE_PIHOLE_PASSWORD", "")
 
 # Update intervals (seconds)
-API_UPDATE_INTERVAL = _get_int_env("CUTIE_API_INTERVAL", 5, min_val=1, max_val=3600)
-SYSTEM_UPDATE_INTERVAL = _get_int_env("CUTIE_SYSTEM_INTERVAL", 2, min_val=1, max_val=60)
+API_UPDATE_INTERVAL = _ints["CUTIE_API_INTERVAL"]
+SYSTEM_UPDATE_INTERVAL = _ints["CUTIE_SYSTEM_INTERVAL"]
 
 # Screen indices
 SCREEN_STATS = 0
@@ -49,22 +77,26 @@ SCREEN_SETTINGS = 5
 TOTAL_SCREENS = 6
 
 # Theme setting
-THEME = os.environ.get("CUTIE_THEME", "default")
+THEME = _env_get("CUTIE_THEME", "default")
 
 # Swipe detection
-SWIPE_THRESHOLD = _get_int_env("CUTIE_SWIPE_THRESHOLD", 50, min_val=10, max_val=200)
+SWIPE_THRESHOLD = _ints["CUTIE_SWIPE_THRESHOLD"]
 
 # Display timeout (minutes, 0 = never)
-SCREEN_TIMEOUT = _get_int_env("CUTIE_SCREEN_TIMEOUT", 0, min_val=0, max_val=60)
+SCREEN_TIMEOUT = _ints["CUTIE_SCREEN_TIMEOUT"]
 
 # Visual settings
-SCANLINES_ENABLED = os.environ.get("CUTIE_SCANLINES", "true").lower() in ("true", "1", "yes")
-SHOW_FPS = os.environ.get("CUTIE_SHOW_FPS", "false").lower() in ("true", "1", "yes")
-BRIGHTNESS = _get_int_env("CUTIE_BRIGHTNESS", 100, min_val=10, max_val=100)
+SCANLINES_ENABLED = _env_get("CUTIE_SCANLINES", "true").lower() in _TRUE
+SHOW_FPS = _env_get("CUTIE_SHOW_FPS", "false").lower() in _TRUE
+BRIGHTNESS = _ints["CUTIE_BRIGHTNESS"]
 
 # Config file path
 CONFIG_FILE = "/etc/cutie-pi/config"
 
+# KEY="value" lines of the config file; any non-comment line with an "=" is
+# kept, split at the first "=" (comments and blank lines never match)
+_CONF_RE = re.compile(r'^[ \t]*(?![#\s])([^=\n]*?)[ \t]*=[ \t]*"?(.*?)"?[ \t]*$', re.M)
+
 
 def save_settings(
     theme: str,
@@ -80,14 +112,11 @@ def save_settings(
     """
     try:
         # Read existing config to preserve Pi-hole credentials and display settings
-        existing_config: dict[str, str] = {}
+        existing_text = ""
         if os.path.exists(CONFIG_FILE):
             with open(CONFIG_FILE) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        existing_config[key.strip()] = value.strip().strip('"')
+                existing_text = f.read()
+        existing_config = dict(_CONF_RE.findall(existing_text))
 
         # Update with new values while preserving others
         existing_config["CUTIE_THEME"] = theme
@@ -97,17 +126,26 @@ def save_settings(
         existing_config["CUTIE_SHOW_FPS"] = "true" if show_fps else "false"
         existing_config["CUTIE_BRIGHTNESS"] = str(brightness)
 
-        # Write updated config
-        with open(CONFIG_FILE, "w") as f:
-            f.write("# Cutie-Pi Configuration\n")
-            f.write("# Settings auto-saved by application\n\n")
-            for key, value in sorted(existing_config.items()):
-                f.write(f'{key}="{value}"\n')
-
-        logger.info(f"Settings saved to {CONFIG_FILE}")
+        # Write updated config to a temp file and swap it in atomically,
+        # so a power cut mid-write can't leave a truncated config behind
+        header = "# Cutie-Pi Configuration\n# Settings auto-saved by application\n\n"
+        body = header + "".join(
+            f'{key}="{value}"\n' for key, value in sorted(existing_config.items())
+        )
+        if body == existing_text:
+            logger.debug("Settings unchanged, %s not rewritten", CONFIG_FILE)
+            return True
+        tmp_file = f"{CONFIG_FILE}.tmp"
+        with open(tmp_file, "w") as f:
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
+
+        logger.info("Settings saved to %s", CONFIG_FILE)
         return True
     except (OSError, PermissionError) as e:
-        logger.error(f"Could not save settings to {CONFIG_FILE}: {e}")
+        logger.error("Could not save settings to %s: %s", CONFIG_FILE, e)
         return False
 
 
@@ -119,119 +157,196 @@ def save_settings(
 # (240x320, 480x320, 800x480, etc.)
 # =============================================================================
 
-class Layout:
-    """Centralized responsive layout calculations"""
+@lru_cache(maxsize=128)
+def max_chars_for_width(available_width: int, char_width: int = 8) -> int:
+    """Calculate max characters that fit in given width (memoized)"""
+    return max(10, available_width // char_width)
 
-    # Base reference dimensions (original design target)
-    _REF_WIDTH = 480
-    _REF_HEIGHT = 320
+
+@dataclass(frozen=True, slots=True)
+class Layout:
+    """Centralized responsive layout values, computed once per screen size"""
 
     # Scale factors
-    scale_x: float = SCREEN_WIDTH / _REF_WIDTH
-    scale_y: float = SCREEN_HEIGHT / _REF_HEIGHT
-    scale_min: float = min(scale_x, scale_y)
+    scale_x: float
+    scale_y: float
+    scale_min: float
+
+    # Common margins & padding
+    margin_xs: int
+    margin_sm: int
+    margin_md: int
+    margin_lg: int
+    padding_xs: int
+    padding_sm: int
+    padding_md: int
+    padding_lg: int
+
+    # Title & header positioning
+    title_x: int
+    title_y: int
+    header_height: int
+
+    # Row/list layouts
+    row_height_sm: int
+    row_height_md: int
+    row_start_y: int
+    row_padding: int
+    rank_x: int
+    content_x: int
+
+    # Box layouts
+    box_margin: int
+    box_width: int
+    box_right_x: int
+    box_padding_x: int
+    box_padding_y: int
+    box_text_offset: int
+
+    # Bar elements
+    bar_height_sm: int
+    bar_height_md: int
+    bar_height_lg: int
+
+    # Right-side elements in lists
+    count_x: int
+    bar_x: int
+    bar_max_width: int
+
+    # Settings screen
+    arrow_left_x: int
+    arrow_right_x: int
+    value_x: int
+    arrow_tap_left_start: int
+    arrow_tap_left_end: int
+    arrow_tap_right_start: int
+    arrow_width: int
+    arrow_half_height: int
+
+    # Graph screen
+    graph_margin: int
+    graph_x: int
+    graph_y: int
+    graph_width: int
+    graph_height: int
+    legend_y: int
+    legend_box_size: int
+    legend_spacing: int
 
-    # ==========================================================================
-    # Common Margins & Padding (scaled from reference 480x320)
-    # ==========================================================================
-    margin_xs: int = max(2, int(4 * scale_x))    # Extra small: ~4px at 480w
-    margin_sm: int = max(4, int(10 * scale_x))   # Small: ~10px at 480w
-    margin_md: int = max(6, int(15 * scale_x))   # Medium: ~15px at 480w
-    margin_lg: int = max(8, int(25 * scale_x))   # Large: ~25px at 480w
+    # Text truncation (characters, not pixels)
+    max_domain_chars: int
+    max_client_chars: int
 
-    padding_xs: int = max(2, int(5 * scale_y))   # Extra small vertical
-    padding_sm: int = max(4, int(8 * scale_y))   # Small vertical
-    padding_md: int = max(6, int(12 * scale_y))  # Medium vertical
-    padding_lg: int = max(8, int(17 * scale_y))  # Large vertical
+    # Screen indicator dots
+    indicator_y: int
+    indicator_size: int
+    indicator_spacing: int
 
-    # ==========================================================================
-    # Title & Header positioning
-    # ==========================================================================
-    title_x: int = margin_sm
-    title_y: int = margin_sm
-    header_height: int = max(30, int(40 * scale_y))
+    @staticmethod
+    def max_chars_for_width(available_width: int, char_width: int = 8) -> int:
+        """Calculate max characters that fit in given width"""
+        return max_chars_for_width(available_width, char_width)
 
-    # ==========================================================================
-    # Row/List layouts
-    # ==========================================================================
-    row_height_sm: int = max(20, int(28 * scale_y))   # For lists (blocked, clients)
-    row_height_md: int = max(28, int(38 * scale_y))   # For settings
-    row_start_y: int = max(30, int(40 * scale_y))     # Y position where rows start
-    row_padding: int = padding_sm                      # Vertical padding within rows
 
-    # Text positioning within rows
-    rank_x: int = margin_md                            # Rank number position
-    content_x: int = max(35, int(50 * scale_x))       # Main content start position
+# Base reference dimensions (original design target)
+_REF_WIDTH = 480
+_REF_HEIGHT = 320
 
-    # ==========================================================================
-    # Box layouts (info boxes, stats)
-    # ==========================================================================
-    box_margin: int = int(SCREEN_WIDTH * 0.03)        # Margin around boxes
-    box_width: int = int((SCREEN_WIDTH - box_margin * 3) / 2)  # Two-column width
-    box_right_x: int = box_margin + box_width + box_margin     # Right column X
 
-    box_padding_x: int = margin_sm                    # Horizontal padding inside boxes
-    box_padding_y: int = padding_sm                   # Vertical padding inside boxes
-    box_text_offset: int = max(20, int(28 * scale_y)) # Offset for second line in box
+def _build_layout(sw: int, sh: int) -> Layout:
+    """Compute every layout value for a screen of sw x sh pixels"""
+    scale_x = sw / _REF_WIDTH
+    scale_y = sh / _REF_HEIGHT
+    scale_min = min(scale_x, scale_y)
 
     # ==========================================================================
-    # Bar elements (progress bars, graphs)
+    # Common Margins & Padding (scaled from reference 480x320)
     # ==========================================================================
-    bar_height_sm: int = max(10, int(12 * scale_y))   # Small bars (in lists)
-    bar_height_md: int = max(18, int(25 * scale_y))   # Medium bars
-    bar_height_lg: int = max(45, int(60 * scale_y))   # Large bars (CPU/RAM)
+    margin_xs = max(2, int(4 * scale_x))    # Extra small: ~4px at 480w
+    margin_sm = max(4, int(10 * scale_x))   # Small: ~10px at 480w
+    margin_md = max(6, int(15 * scale_x))   # Medium: ~15px at 480w
+    margin_lg = max(8, int(25 * scale_x))   # Large: ~25px at 480w
 
-    # ==========================================================================
-    # Right-side elements (counts, bars in lists)
-    # ==========================================================================
-    count_x: int = SCREEN_WIDTH - int(SCREEN_WIDTH * 0.25)      # Count text position
-    bar_x: int = SCREEN_WIDTH - int(SCREEN_WIDTH * 0.15)        # Small bar position
-    bar_max_width: int = int(SCREEN_WIDTH * 0.125)              # Max width for list bars
+    padding_xs = max(2, int(5 * scale_y))   # Extra small vertical
+    padding_sm = max(4, int(8 * scale_y))   # Small vertical
+    padding_md = max(6, int(12 * scale_y))  # Medium vertical
+    padding_lg = max(8, int(17 * scale_y))  # Large vertical
 
     # ==========================================================================
-    # Settings screen specific
+    # Box layouts (info boxes, stats)
     # ==========================================================================
-    arrow_left_x: int = int(SCREEN_WIDTH * 0.56)
-    arrow_right_x: int = SCREEN_WIDTH - int(SCREEN_WIDTH * 0.0625)
-    value_x: int = int(SCREEN_WIDTH * 0.60)
-
-    # Arrow tap zones
-    arrow_tap_left_start: int = int(SCREEN_WIDTH * 0.54)
-    arrow_tap_left_end: int = int(SCREEN_WIDTH * 0.62)
-    arrow_tap_right_start: int = SCREEN_WIDTH - 50
-
-    # Arrow dimensions
-    arrow_width: int = max(8, int(10 * scale_x))
-    arrow_half_height: int = max(5, int(7 * scale_y))
+    box_margin = int(sw * 0.03)                       # Margin around boxes
+    box_width = int((sw - box_margin * 3) / 2)        # Two-column width
 
     # ==========================================================================
     # Graph screen specific
     # ==========================================================================
-    graph_margin: int = max(30, int(40 * scale_x))
-    graph_x: int = graph_margin
-    graph_y: int = max(30, int(40 * scale_y))
-    graph_width: int = SCREEN_WIDTH - max(45, int(60 * scale_x))
-    graph_height: int = SCREEN_HEIGHT - max(70, int(90 * scale_y))
-
-    legend_y: int = SCREEN_HEIGHT - max(30, int(40 * scale_y))
-    legend_box_size: int = max(8, int(10 * scale_min))
-    legend_spacing: int = margin_md
-
-    # ==========================================================================
-    # Text truncation (characters, not pixels)
-    # ==========================================================================
-    @staticmethod
-    def max_chars_for_width(available_width: int, char_width: int = 8) -> int:
-        """Calculate max characters that fit in given width"""
-        return max(10, available_width // char_width)
-
-    # Pre-calculated max chars for common uses
-    max_domain_chars: int = max(10, int(SCREEN_WIDTH / 12))
-    max_client_chars: int = max(10, int(SCREEN_WIDTH / 12))
-
-    # ==========================================================================
-    # Screen indicator dots
-    # ==========================================================================
-    indicator_y: int = SCREEN_HEIGHT - margin_sm
-    indicator_size: int = max(4, int(6 * scale_min))
-    indicator_spacing: int = max(8, int(12 * scale_x))
+    graph_margin = max(30, int(40 * scale_x))
+
+    return Layout(
+        scale_x=scale_x,
+        scale_y=scale_y,
+        scale_min=scale_min,
+        margin_xs=margin_xs,
+        margin_sm=margin_sm,
+        margin_md=margin_md,
+        margin_lg=margin_lg,
+        padding_xs=padding_xs,
+        padding_sm=padding_sm,
+        padding_md=padding_md,
+        padding_lg=padding_lg,
+        # Title & header positioning
+        title_x=margin_sm,
+        title_y=margin_sm,
+        header_height=max(30, int(40 * scale_y)),
+        # Row/list layouts
+        row_height_sm=max(20, int(28 * scale_y)),   # For lists (blocked, clients)
+        row_height_md=max(28, int(38 * scale_y)),   # For settings
+        row_start_y=max(30, int(40 * scale_y)),     # Y position where rows start
+        row_padding=padding_sm,                     # Vertical padding within rows
+        rank_x=margin_md,                           # Rank number position
+        content_x=max(35, int(50 * scale_x)),       # Main content start position
+        # Box layouts
+        box_margin=box_margin,
+        box_width=box_width,
+        box_right_x=box_margin + box_width + box_margin,  # Right column X
+        box_padding_x=margin_sm,                    # Horizontal padding inside boxes
+        box_padding_y=padding_sm,                   # Vertical padding inside boxes
+        box_text_offset=max(20, int(28 * scale_y)), # Offset for second line in box
+        # Bar elements (progress bars, graphs)
+        bar_height_sm=max(10, int(12 * scale_y)),   # Small bars (in lists)
+        bar_height_md=max(18, int(25 * scale_y)),   # Medium bars
+        bar_height_lg=max(45, int(60 * scale_y)),   # Large bars (CPU/RAM)
+        # Right-side elements (counts, bars in lists)
+        count_x=sw - int(sw * 0.25),                # Count text position
+        bar_x=sw - int(sw * 0.15),                  # Small bar position
+        bar_max_width=int(sw * 0.125),              # Max width for list bars
+        # Settings screen specific
+        arrow_left_x=int(sw * 0.56),
+        arrow_right_x=sw - int(sw * 0.0625),
+        value_x=int(sw * 0.60),
+        arrow_tap_left_start=int(sw * 0.54),
+        arrow_tap_left_end=int(sw * 0.62),
+        arrow_tap_right_start=sw - 50,
+        arrow_width=max(8, int(10 * scale_x)),
+        arrow_half_height=max(5, int(7 * scale_y)),
+        # Graph screen specific
+        graph_margin=graph_margin,
+        graph_x=graph_margin,
+        graph_y=max(30, int(40 * scale_y)),
+        graph_width=sw - max(45, int(60 * scale_x)),
+        graph_height=sh - max(70, int(90 * scale_y)),
+        legend_y=sh - max(30, int(40 * scale_y)),
+        legend_box_size=max(8, int(10 * scale_min)),
+        legend_spacing=margin_md,
+        # Text truncation (characters, not pixels)
+        max_domain_chars=max_chars_for_width(sw, 12),
+        max_client_chars=max_chars_for_width(sw, 12),
+        # Screen indicator dots
+        indicator_y=sh - margin_sm,
+        indicator_size=max(4, int(6 * scale_min)),
+        indicator_spacing=max(8, int(12 * scale_x)),
+    )
+
+
+layout = _build_layout(SCREEN_WIDTH, SCREEN_HEIGHT)
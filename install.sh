@@ -92,10 +92,10 @@ get_actual_user() {
 install_dependencies() {
     echo -e "${GREEN}[1/6]${NC} Installing system dependencies..."
     apt-get update -qq
-    apt-get install -y -qq python3 python3-pygame python3-requests xserver-xorg xinit fonts-dejavu curl > /dev/null
+    apt-get install -y -qq python3 python3-pygame python3-urllib3 xserver-xorg xinit fonts-dejavu curl > /dev/null
 
     echo -e "${GREEN}[2/6]${NC} Verifying Python dependencies..."
-    python3 -c "import pygame, requests" 2>/dev/null || {
+    python3 -c "import pygame, urllib3" 2>/dev/null || {
         echo -e "${RED}Error: Python dependencies not installed correctly${NC}"
         exit 1
     }
@@ -3,8 +3,12 @@
 
 import contextlib
 import os
+import queue
+import shutil
 import subprocess
+import threading
 import time
+from collections.abc import Callable
 
 import pygame
 
@@ -42,6 +46,37 @@ from ui.colors import reload_theme
 from ui.components import UIComponents
 from ui.fonts import PixelFont
 from utils.logger import logger
+from utils.system_info import get_local_ip
+
+# Only these events are dispatched; everything else is kept out of the SDL queue
+HANDLED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+)
+
+# Candidate backlight sysfs directories for the supported displays
+BACKLIGHT_DIRS = [
+    "/sys/class/backlight/rpi_backlight",
+    "/sys/class/backlight/10-0045",
+    "/sys/class/backlight/soc:backlight",
+    "/sys/class/backlight/backlight",
+]
+FB_BLANK_PATH = "/sys/class/graphics/fb0/blank"
+
+# Fixed logic step (seconds); animations advance per step, independent of FPS
+LOGIC_STEP = 1 / 30
+# Max logic steps run to catch up after a stall, so we never spiral
+MAX_CATCHUP_STEPS = 5
+
+# Shared argument for screens whose update() takes no data
+_NO_DATA: dict = {}
+
+# Frame rate while nothing on screen changes; input still wakes the loop at once
+IDLE_FPS = 5
+# Longest block (ms) waiting for a touch while the display sleeps
+SLEEP_WAIT_MS = 1000
 
 
 class Dashboard:
@@ -55,8 +90,20 @@ class Dashboard:
         # Setup display
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Pi-hole Dashboard")
+        logger.info(
+            "Display: %s driver, %dx%d, surface flags %#x",
+            pygame.display.get_driver(),
+            *self.screen.get_size(),
+            self.screen.get_flags(),
+        )
+        self._screen_width = self.screen.get_width()
+        self._screen_rect = self.screen.get_rect()
         pygame.mouse.set_visible(False)
 
+        # Drop high-rate motion/window events before they enter the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+
         # Initialize components
         self.clock = pygame.time.Clock()
         self.font = PixelFont()
@@ -73,6 +120,13 @@ class Dashboard:
             SettingsScreen(self.font, self.ui),
         ]
 
+        # Bound update methods of the screens fed by each API refresh
+        self._refresh_updaters = (
+            (self.screens[SCREEN_GRAPH].update, "overtime"),
+            (self.screens[SCREEN_BLOCKED].update, "blocked"),
+            (self.screens[SCREEN_CLIENTS].update, "clients"),
+        )
+
         # Current theme
         self.current_theme = THEME
 
@@ -82,9 +136,17 @@ class Dashboard:
         self.screen_timeout = SCREEN_TIMEOUT  # minutes, 0 = never
         self.brightness = BRIGHTNESS
         self.api_update_interval = API_UPDATE_INTERVAL
-        self.last_activity = time.time()
+        self.last_activity = pygame.time.get_ticks()  # ms since pygame.init()
+        self._settings_dirty = False  # Changed since the last save
         self.display_asleep = False
 
+        # Locate backlight controls once; the working paths never change
+        self._detect_backlight()
+
+        # xset is only available under X11; skip DPMS entirely when it's missing
+        self._xset_path = shutil.which("xset")
+        self._xset_env = {**os.environ, "DISPLAY": ":0"}
+
         # Apply initial brightness if not 100%
         if self.brightness != 100:
             self._set_brightness(self.brightness)
@@ -94,6 +156,7 @@ class Dashboard:
         settings_screen.scanlines_enabled = self.scanlines_enabled
         settings_screen.show_fps = self.show_fps
         settings_screen.brightness = self.brightness
+        settings_screen.update({"current_theme": self.current_theme})
         # Find the index for api_interval and screen_timeout
         if self.api_update_interval in settings_screen.API_INTERVALS:
             settings_screen.api_interval_index = settings_screen.API_INTERVALS.index(
@@ -107,45 +170,66 @@ class Dashboard:
         # State
         self.current_screen = 0
         self.running = True
-        self.last_api_update: float = 0
+
+        # Pi-hole data is fetched by a background thread so the UI never
+        # blocks on the network; update() only consumes finished results
+        self._summary: dict | None = None  # Latest summary, animated every step
+        self._api_queue: queue.Queue[dict[str, dict]] = queue.Queue(maxsize=1)
+        self._api_stop = threading.Event()
+        self._api_wake = threading.Event()
+        self._api_thread = threading.Thread(target=self._api_worker, daemon=True)
 
         # Touch handling
         self.touch_start_x = 0
         self.touch_start_y = 0
         self.is_touching = False
 
-        # Get DNS IP for stats screen
-        self.dns_ip = self._get_dns_ip()
+        # Event type -> handler, covering exactly HANDLED_EVENTS
+        self._event_handlers: dict[int, Callable[[pygame.event.Event], None]] = {
+            pygame.QUIT: self._handle_quit,
+            pygame.KEYDOWN: self._handle_keydown,
+            pygame.MOUSEBUTTONDOWN: self._handle_mouse_down,
+            pygame.MOUSEBUTTONUP: self._handle_mouse_up,
+        }
 
-    def _get_dns_ip(self) -> str:
-        """Get the device IP address"""
-        try:
-            result = subprocess.run(
-                ["hostname", "-I"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            return result.stdout.strip().split()[0] if result.stdout.strip() else "N/A"
-        except Exception:
-            return "N/A"
+        # Per-frame input aggregation (see handle_events)
+        self._screen_step = 0
+        self._pending_actions: dict[str, dict] = {}
+
+        # Set when dashboard-level state changes and the frame must be redrawn
+        self._dirty = True
+
+        # Rendered FPS counter (value, surface) and when it was last checked
+        self._fps_cache: tuple[int, pygame.Surface] | None = None
+        # Pre-rendered "FPS:" and digit glyphs the counter is composed from
+        self._fps_glyphs: dict[str, pygame.Surface] | None = None
+        self._fps_cache_time = 0.0
+        # Last FPS blit: (screen rect, pixels it covered, surface blitted)
+        self._fps_blit: tuple[pygame.Rect, pygame.Surface, pygame.Surface] | None = None
+
+        # Theme colors used every frame, refreshed by _change_theme
+        self._refresh_cached_colors()
+
+    def _handle_quit(self, event: pygame.event.Event) -> None:
+        """Handle window close events"""
+        self.running = False
 
     def _handle_keydown(self, event: pygame.event.Event) -> None:
         """Handle keyboard events"""
-        self.last_activity = time.time()
+        self.last_activity = pygame.time.get_ticks()
         if self.display_asleep:
             self._wake_display()
             return
         if event.key == pygame.K_ESCAPE:
             self.running = False
         elif event.key == pygame.K_LEFT:
-            self.current_screen = (self.current_screen - 1) % TOTAL_SCREENS
+            self._screen_step -= 1
         elif event.key == pygame.K_RIGHT:
-            self.current_screen = (self.current_screen + 1) % TOTAL_SCREENS
+            self._screen_step += 1
 
     def _handle_mouse_down(self, event: pygame.event.Event) -> None:
         """Handle mouse/touch down events"""
-        self.last_activity = time.time()
+        self.last_activity = pygame.time.get_ticks()
         if self.display_asleep:
             self._wake_display()
             self.is_touching = False
@@ -161,33 +245,51 @@ class Dashboard:
         end_x, end_y = event.pos
         diff_x = end_x - self.touch_start_x
 
-        # Check for tap (not swipe) on settings screen
-        if abs(diff_x) < SWIPE_THRESHOLD and self.current_screen == SCREEN_SETTINGS:
-            action = self.screens[SCREEN_SETTINGS].handle_tap((end_x, end_y))
-            if action:
-                self._handle_settings_action(action)
-        elif diff_x < -SWIPE_THRESHOLD:
-            self.current_screen = (self.current_screen + 1) % TOTAL_SCREENS
-        elif diff_x > SWIPE_THRESHOLD:
-            self.current_screen = (self.current_screen - 1) % TOTAL_SCREENS
+        # Swipes only move the net step; handle_events wraps it once per frame
+        if diff_x <= -SWIPE_THRESHOLD:
+            self._screen_step += 1
+        elif diff_x >= SWIPE_THRESHOLD:
+            self._screen_step -= 1
+        else:
+            # Check for tap (not swipe) on settings screen
+            screen = (self.current_screen + self._screen_step) % TOTAL_SCREENS
+            if screen == SCREEN_SETTINGS:
+                action = self.screens[SCREEN_SETTINGS].handle_tap((end_x, end_y))
+                if action:
+                    # Later actions of the same type supersede earlier ones
+                    self._pending_actions[action["action"]] = action
 
         self.is_touching = False
 
-    def handle_events(self) -> None:
-        """Handle pygame events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                self._handle_keydown(event)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._handle_mouse_down(event)
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self._handle_mouse_up(event)
+    def handle_events(self, first: pygame.event.Event | None = None) -> None:
+        """Handle pygame events, applying their net effect once per frame.
+
+        first is an event already taken off the queue (by _wait_for_input);
+        it is handled ahead of the queued ones to keep their order.
+        """
+        self._screen_step = 0
+        self._pending_actions = {}
+
+        dispatch = self._event_handlers
+        if first is not None:
+            dispatch[first.type](first)
+        pygame.event.pump()
+        for event in pygame.event.get(HANDLED_EVENTS, pump=False):
+            dispatch[event.type](event)
+
+        if self._screen_step:
+            step = self._screen_step
+            self.current_screen = (self.current_screen + step) % TOTAL_SCREENS
+            self._dirty = True
+        for action in self._pending_actions.values():
+            self._handle_settings_action(action)
+            self._dirty = True
 
     def _handle_settings_action(self, action: dict) -> None:
         """Handle settings changes"""
         action_type = action.get("action")
+        if action_type != "lock_settings":
+            self._settings_dirty = True
 
         if action_type == "change_theme":
             self._change_theme(action["theme"])
@@ -200,16 +302,28 @@ class Dashboard:
             self._set_brightness(action["value"])
         elif action_type == "set_api_interval":
             self.api_update_interval = action["value"]
+            self._api_wake.set()  # Re-arm the worker's wait with the new interval
         elif action_type == "set_timeout":
             self.screen_timeout = action["value"]
-        elif action_type == "lock_settings":
+        elif action_type == "lock_settings" and self._settings_dirty:
             self._save_settings()
 
     def _change_theme(self, theme_name: str) -> None:
         """Change the current theme"""
         reload_theme(theme_name)
         self.current_theme = theme_name
-        logger.info(f"Theme changed to: {theme_name}")
+        self._refresh_cached_colors()
+        self.screens[SCREEN_SETTINGS].update({"current_theme": theme_name})
+        logger.info("Theme changed to: %s", theme_name)
+
+    def _refresh_cached_colors(self) -> None:
+        """Resolve the theme colors draw() uses and drop surfaces rendered in them"""
+        self._bg_color = colors.BLACK()
+        self._fps_color = colors.GRAY()
+        self._fps_cache = None
+        self._fps_glyphs = None
+        for screen in self.screens:
+            screen.invalidate_background()
 
     def _save_settings(self) -> None:
         """Save current settings to config file"""
@@ -222,37 +336,105 @@ class Dashboard:
             brightness=self.brightness,
         )
         if success:
+            self._settings_dirty = False
             logger.info("Settings saved to config file")
         else:
             logger.warning("Failed to save settings to config file")
 
+    def _detect_backlight(self) -> None:
+        """Find the working backlight and framebuffer sysfs paths once"""
+        self._bl_brightness_path: str | None = None
+        self._bl_power_path: str | None = None
+        self._bl_max = 0
+        self._bl_fd: int | None = None
+        # Current raw brightness, tracked from our own writes so that
+        # sleep never has to read it back
+        self._bl_value: str | None = None
+
+        for bl_dir in BACKLIGHT_DIRS:
+            try:
+                with open(f"{bl_dir}/max_brightness") as f:
+                    self._bl_max = int(f.read().strip())
+            except (OSError, ValueError):
+                continue
+            self._bl_brightness_path = f"{bl_dir}/brightness"
+            try:
+                with open(self._bl_brightness_path) as f:
+                    self._bl_value = f.read().strip()
+            except OSError:
+                pass
+            # Keep the brightness attribute open; each change is then one pwrite
+            try:
+                self._bl_fd = os.open(self._bl_brightness_path, os.O_WRONLY)
+            except OSError as e:
+                logger.warning("Backlight not writable: %s", e)
+            break
+
+        for bl_dir in BACKLIGHT_DIRS:
+            if os.path.exists(f"{bl_dir}/bl_power"):
+                self._bl_power_path = f"{bl_dir}/bl_power"
+                break
+
+        self._fb_blank_path = FB_BLANK_PATH if os.path.exists(FB_BLANK_PATH) else None
+        logger.debug(
+            "Display control: brightness=%s, power=%s, blank=%s",
+            self._bl_brightness_path,
+            self._bl_power_path,
+            self._fb_blank_path,
+        )
+
+    def _write_sysfs(self, path: str, value: str) -> bool:
+        """Write a value to a sysfs attribute, returning True on success"""
+        # sysfs is byte-oriented: skip the buffered text file stack
+        try:
+            fd = os.open(path, os.O_WRONLY)
+        except OSError:
+            return False
+        try:
+            os.write(fd, value.encode())
+            return True
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+
+    def _write_brightness(self, value: str) -> bool:
+        """Write a raw brightness value through the persistent backlight fd"""
+        if self._bl_fd is None:
+            return False
+        try:
+            os.pwrite(self._bl_fd, value.encode(), 0)
+            return True
+        except OSError:
+            return False
+
     def _set_brightness(self, value: int) -> None:
         """Set screen brightness (0-100)"""
-        # Try common backlight paths for Raspberry Pi
-        brightness_paths = [
-            "/sys/class/backlight/rpi_backlight/brightness",
-            "/sys/class/backlight/10-0045/brightness",
-            "/sys/class/backlight/backlight/brightness",
-        ]
+        if self._bl_brightness_path is None:
+            logger.error("Could not set brightness - no backlight found")
+            return
 
-        for path in brightness_paths:
-            try:
-                # Read max brightness
-                max_path = path.replace("brightness", "max_brightness")
-                with open(max_path) as f:
-                    max_brightness = int(f.read().strip())
-
-                # Calculate actual value
-                actual = int((value / 100) * max_brightness)
-
-                with open(path, "w") as f:
-                    f.write(str(actual))
-                logger.info(f"Brightness set to {value}%")
-                return
-            except OSError:
-                continue
+        actual = int((value / 100) * self._bl_max)
+        if self._write_brightness(str(actual)):
+            self._bl_value = str(actual)
+            logger.info("Brightness set to %s%%", value)
+        else:
+            logger.error("Could not set brightness via %s", self._bl_brightness_path)
 
-        logger.error("Could not set brightness - no backlight found")
+    def _xset_dpms(self, state: str) -> bool:
+        """Force DPMS on/off via xset, returning True if it succeeded"""
+        if self._xset_path is None:
+            return False
+        try:
+            result = subprocess.run(
+                [self._xset_path, "dpms", "force", state],
+                env=self._xset_env,
+                capture_output=True,
+                timeout=2,
+            )
+            return result.returncode == 0
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return False
 
     def _sleep_display(self) -> None:
         """Put display to sleep using multiple methods for broad hardware support"""
@@ -261,68 +443,27 @@ class Dashboard:
 
         sleep_success = False
 
-        # Method 1: Framebuffer blanking (works for most displays including PiTFT)
-        try:
-            with open("/sys/class/graphics/fb0/blank", "w") as f:
-                f.write("1")  # 1 = blank
+        # Method 1: Framebuffer blanking, 1 = blank (works on most displays, PiTFT too)
+        if self._fb_blank_path and self._write_sysfs(self._fb_blank_path, "1"):
             sleep_success = True
             logger.debug("Display sleep: framebuffer blanking")
-        except (FileNotFoundError, PermissionError, OSError):
-            pass
-
-        # Method 2: Backlight power control (various paths for different displays)
-        bl_power_paths = [
-            "/sys/class/backlight/rpi_backlight/bl_power",
-            "/sys/class/backlight/10-0045/bl_power",
-            "/sys/class/backlight/soc:backlight/bl_power",
-            "/sys/class/backlight/backlight/bl_power",
-        ]
-        for path in bl_power_paths:
-            try:
-                with open(path, "w") as f:
-                    f.write("1")  # 1 = off
-                sleep_success = True
-                logger.debug(f"Display sleep: backlight power {path}")
-                break
-            except (FileNotFoundError, PermissionError, OSError):
-                continue
 
-        # Method 3: Backlight brightness to 0
-        bl_brightness_paths = [
-            "/sys/class/backlight/rpi_backlight/brightness",
-            "/sys/class/backlight/10-0045/brightness",
-            "/sys/class/backlight/soc:backlight/brightness",
-            "/sys/class/backlight/backlight/brightness",
-        ]
-        for path in bl_brightness_paths:
-            try:
-                # Store original brightness for wake
-                with open(path) as f:
-                    self._saved_brightness = f.read().strip()
-                with open(path, "w") as f:
-                    f.write("0")
-                sleep_success = True
-                self._brightness_path = path
-                logger.debug(f"Display sleep: brightness to 0 via {path}")
-                break
-            except (FileNotFoundError, PermissionError, OSError):
-                continue
+        # Method 2: Backlight power control (1 = off)
+        if self._bl_power_path and self._write_sysfs(self._bl_power_path, "1"):
+            sleep_success = True
+            logger.debug("Display sleep: backlight power %s", self._bl_power_path)
 
-        # Method 4: DPMS via xset (for X11 environments)
-        env = os.environ.copy()
-        env["DISPLAY"] = ":0"
-        try:
-            result = subprocess.run(
-                ["xset", "dpms", "force", "off"],
-                env=env,
-                capture_output=True,
-                timeout=2,
+        # Method 3: Backlight brightness to 0; _bl_value keeps the original for wake
+        if self._bl_value is not None and self._write_brightness("0"):
+            sleep_success = True
+            logger.debug(
+                "Display sleep: brightness to 0 via %s", self._bl_brightness_path
             )
-            if result.returncode == 0:
-                sleep_success = True
-                logger.debug("Display sleep: DPMS force off")
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+
+        # Method 4: DPMS via xset (for X11 environments)
+        if self._xset_dpms("off"):
+            sleep_success = True
+            logger.debug("Display sleep: DPMS force off")
 
         self.display_asleep = True
         if sleep_success:
@@ -335,99 +476,147 @@ class Dashboard:
         if not self.display_asleep:
             return
 
-        # Method 1: Framebuffer unblanking
-        try:
-            with open("/sys/class/graphics/fb0/blank", "w") as f:
-                f.write("0")  # 0 = unblank
+        # Method 1: Framebuffer unblanking (0 = unblank)
+        if self._fb_blank_path and self._write_sysfs(self._fb_blank_path, "0"):
             logger.debug("Display wake: framebuffer unblanking")
-        except (FileNotFoundError, PermissionError, OSError):
-            pass
-
-        # Method 2: Backlight power control
-        bl_power_paths = [
-            "/sys/class/backlight/rpi_backlight/bl_power",
-            "/sys/class/backlight/10-0045/bl_power",
-            "/sys/class/backlight/soc:backlight/bl_power",
-            "/sys/class/backlight/backlight/bl_power",
-        ]
-        for path in bl_power_paths:
-            try:
-                with open(path, "w") as f:
-                    f.write("0")  # 0 = on
-                logger.debug(f"Display wake: backlight power {path}")
-                break
-            except (FileNotFoundError, PermissionError, OSError):
-                continue
+
+        # Method 2: Backlight power control (0 = on)
+        if self._bl_power_path and self._write_sysfs(self._bl_power_path, "0"):
+            logger.debug("Display wake: backlight power %s", self._bl_power_path)
 
         # Method 3: Restore backlight brightness
-        if hasattr(self, "_brightness_path") and hasattr(self, "_saved_brightness"):
-            try:
-                with open(self._brightness_path, "w") as f:
-                    f.write(self._saved_brightness)
-                logger.debug(f"Display wake: brightness restored via {self._brightness_path}")
-            except (FileNotFoundError, PermissionError, OSError):
-                pass
+        if self._bl_value is not None and self._write_brightness(self._bl_value):
+            logger.debug(
+                "Display wake: brightness restored via %s", self._bl_brightness_path
+            )
 
         # Method 4: DPMS via xset
-        env = os.environ.copy()
-        env["DISPLAY"] = ":0"
-        try:
-            subprocess.run(
-                ["xset", "dpms", "force", "on"],
-                env=env,
-                capture_output=True,
-                timeout=2,
-            )
+        if self._xset_dpms("on"):
             logger.debug("Display wake: DPMS force on")
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            pass
 
         self.display_asleep = False
-        self.last_activity = time.time()
+        self.last_activity = pygame.time.get_ticks()
+        self._dirty = True
+        self._api_wake.set()  # Refresh data skipped while asleep
         logger.info("Display waking")
 
+    def _api_worker(self) -> None:
+        """Poll the Pi-hole API every api_update_interval seconds"""
+        sent: dict[str, dict] = {}
+        while not self._api_stop.is_set():
+            # Nobody sees the data while the display sleeps; waking sets _api_wake
+            if not self.display_asleep:
+                try:
+                    api_data = self.api.get_all()
+                    # A copy: the API keeps and may hand back the same dict
+                    api_data["summary"] = {
+                        **api_data["summary"],
+                        "dns_ip": get_local_ip(),
+                    }
+                except Exception as e:
+                    # Keep polling; the screens hold their last data meanwhile
+                    logger.error("API refresh failed: %s", e)
+                    api_data = {}
+
+                # Only hand over the parts whose content changed since last time
+                changed = {
+                    key: data for key, data in api_data.items() if sent.get(key) != data
+                }
+                if changed:
+                    sent.update(changed)
+                    # Fold into a snapshot update() hasn't taken yet, so the
+                    # queue holds at most one item however long the UI stalls
+                    with contextlib.suppress(queue.Empty):
+                        changed = {**self._api_queue.get_nowait(), **changed}
+                    self._api_queue.put(changed)
+
+            self._api_wake.wait(self.api_update_interval)
+            self._api_wake.clear()
+
     def update(self) -> None:
         """Update dashboard data"""
-        current_time = time.time()
-
         # Check for screen timeout
         if self.screen_timeout > 0 and not self.display_asleep:
-            idle_time = current_time - self.last_activity
-            if idle_time > self.screen_timeout * 60:  # Convert minutes to seconds
+            idle_ms = pygame.time.get_ticks() - self.last_activity
+            if idle_ms > self.screen_timeout * 60_000:  # Convert minutes to ms
                 self._sleep_display()
+        # Nothing is shown while asleep; queued data is picked up on wake
+        if self.display_asleep:
+            return
 
-        if current_time - self.last_api_update > self.api_update_interval:
-            # Fetch all API data
-            summary = self.api.get_summary()
-            summary["dns_ip"] = self.dns_ip
-
-            overtime = self.api.get_overtime()
-            blocked = self.api.get_top_blocked()
-            clients = self.api.get_top_clients()
-
-            # Store data for continuous updates
-            self._summary = summary
-            self._overtime = overtime
-            self._blocked = blocked
-            self._clients = clients
-
-            self.last_api_update = current_time
+        new_data: dict[str, dict] = {}
+        with contextlib.suppress(queue.Empty):
+            new_data = self._api_queue.get_nowait()
 
-        # Update screens every frame for animations
-        if hasattr(self, "_summary"):
+        # Stats screen animates its counters on every step
+        if "summary" in new_data:
+            self._summary = new_data["summary"]
+        if self._summary is not None:
             self.screens[SCREEN_STATS].update(self._summary)
-        if hasattr(self, "_overtime"):
-            self.screens[SCREEN_GRAPH].update(self._overtime)
-        if hasattr(self, "_blocked"):
-            self.screens[SCREEN_BLOCKED].update(self._blocked)
-        if hasattr(self, "_clients"):
-            self.screens[SCREEN_CLIENTS].update(self._clients)
 
-        # System screen updates more frequently (handled internally)
-        self.screens[SCREEN_SYSTEM].update({})
+        # Static screens only need updating when their data changed
+        for update_screen, key in self._refresh_updaters:
+            if key in new_data:
+                update_screen(new_data[key])
 
-        # Settings screen
-        self.screens[SCREEN_SETTINGS].update({"current_theme": self.current_theme})
+        # System screen updates more frequently (handled internally)
+        self.screens[SCREEN_SYSTEM].update(_NO_DATA)
+
+    def _get_fps_text(self) -> pygame.Surface:
+        """Get the FPS counter surface, re-rendered at most twice a second"""
+        now = time.monotonic()
+        cache = self._fps_cache
+        if cache is not None and now - self._fps_cache_time < 0.5:
+            return cache[1]
+
+        # Theme changes clear the cache, so only the value can be stale here
+        fps = round(self.clock.get_fps())
+        if cache is None or cache[0] != fps:
+            cache = self._fps_cache = (fps, self._compose_fps_text(fps))
+        self._fps_cache_time = now
+        return cache[1]
+
+    def _compose_fps_text(self, fps: int) -> pygame.Surface:
+        """Build the FPS counter from cached glyphs instead of the rasterizer"""
+        glyphs = self._fps_glyphs
+        if glyphs is None:
+            # Converted once to the display format, as they are blitted often
+            glyphs = {
+                text: self.font.tiny.render(text, True, self._fps_color).convert_alpha()
+                for text in ("FPS:", *"0123456789")
+            }
+            self._fps_glyphs = glyphs
+
+        parts = [glyphs["FPS:"], *(glyphs[digit] for digit in str(fps))]
+        width = sum(part.get_width() for part in parts)
+        height = max(part.get_height() for part in parts)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        x = 0
+        for part in parts:
+            surface.blit(part, (x, 0))
+            x += part.get_width()
+        return surface
+
+    def _blit_fps(self, fps_text: pygame.Surface) -> pygame.Rect:
+        """Blit the FPS counter, keeping the pixels it covers for later restore"""
+        screen = self.screen
+        x = (self._screen_width - fps_text.get_width()) // 2
+        rect = fps_text.get_rect(topleft=(x, 5))
+        rect = rect.clip(self._screen_rect)
+        background = screen.subsurface(rect).copy()
+        screen.blit(fps_text, rect.topleft)
+        self._fps_blit = (rect, background, fps_text)
+        return rect
+
+    def _draw_fps_only(self) -> None:
+        """Refresh just the FPS counter area of an otherwise unchanged frame"""
+        fps_text = self._get_fps_text()
+        if self._fps_blit is None or self._fps_blit[2] is fps_text:
+            return
+        old_rect, background, _ = self._fps_blit
+        self.screen.blit(background, old_rect.topleft)
+        new_rect = self._blit_fps(fps_text)
+        pygame.display.update([old_rect, new_rect])
 
     def draw(self) -> None:
         """Draw the current screen"""
@@ -435,37 +624,98 @@ class Dashboard:
         if self.display_asleep:
             return
 
-        self.screen.fill(colors.BLACK())
+        # Only the FPS counter may have changed: push just its rects
+        current_index = self.current_screen
+        current = self.screens[current_index]
+        show_fps = self.show_fps
+        if not (self._dirty or current.dirty):
+            if show_fps:
+                self._draw_fps_only()
+            return
+        # The frame is always redrawn whole, but may only be pushed in part
+        dirty_rects = None if self._dirty else current.dirty_rects
+        self._dirty = False
+        current.dirty = False
+        current.dirty_rects = None
+
+        screen = self.screen
+        ui = self.ui
+        screen.fill(self._bg_color)
 
         # Draw current screen
-        self.screens[self.current_screen].draw(self.screen)
+        current.draw(screen)
 
         # Draw screen indicators
-        self.ui.draw_screen_indicators(self.screen, self.current_screen, TOTAL_SCREENS)
+        ui.draw_screen_indicators(screen, current_index, TOTAL_SCREENS)
 
         # Draw scanlines effect (if enabled)
         if self.scanlines_enabled:
-            self.ui.draw_scanlines(self.screen)
+            ui.draw_scanlines(screen)
 
         # Draw FPS counter (if enabled)
-        if self.show_fps:
-            fps = self.clock.get_fps()
-            fps_text = self.font.tiny.render(f"FPS:{fps:.0f}", True, colors.GRAY())
-            surface_width = self.screen.get_width()
-            self.screen.blit(fps_text, ((surface_width - fps_text.get_width()) // 2, 5))
-
-        pygame.display.flip()
+        previous_fps = self._fps_blit
+        self._fps_blit = None
+        if show_fps:
+            fps_rect = self._blit_fps(self._get_fps_text())
+            if dirty_rects is not None:
+                dirty_rects.append(fps_rect)
+        if dirty_rects is not None and previous_fps is not None:
+            dirty_rects.append(previous_fps[0])
+
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
+    def _wait_for_input(self, timeout_ms: int) -> None:
+        """Block until an input event arrives or timeout_ms passes"""
+        event = pygame.event.wait(timeout_ms)
+        if event.type in self._event_handlers:
+            # Handle it now, with anything queued behind it; reposting would
+            # move it behind those (e.g. a tap's release ahead of its press)
+            self.handle_events(event)
+        # Keep the clock's frame timing (and FPS counter) in step
+        self.clock.tick()
 
     def run(self) -> None:
         """Main loop"""
         logger.info("Starting Pi-hole Dashboard...")
+        self._api_thread.start()
 
+        # Logic runs in fixed LOGIC_STEP increments; drawing runs once per frame
+        accumulator = 0.0
+        previous = time.monotonic()
         while self.running:
             self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
 
+            now = time.monotonic()
+            if self.display_asleep:
+                # Nothing is shown: block until a touch instead of stepping logic
+                accumulator = 0.0
+                previous = now
+                self._wait_for_input(SLEEP_WAIT_MS)
+                continue
+            accumulator = min(
+                accumulator + now - previous, LOGIC_STEP * MAX_CATCHUP_STEPS
+            )
+            previous = now
+            while accumulator >= LOGIC_STEP:
+                self.update()
+                accumulator -= LOGIC_STEP
+
+            # Full frame rate only while something is animating or changing
+            busy = self._dirty or self.screens[self.current_screen].dirty
+            self.draw()
+            if busy:
+                self.clock.tick(FPS)
+            else:
+                self._wait_for_input(1000 // IDLE_FPS)
+
+        self._api_stop.set()
+        self._api_wake.set()
+        self.api.close()
+        if self._bl_fd is not None:
+            os.close(self._bl_fd)
         pygame.quit()
         logger.info("Dashboard closed.")
 
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 
 import pygame
 
+from ui import colors
 from ui.components import UIComponents
 from ui.fonts import PixelFont
 
@@ -14,6 +15,12 @@ class BaseScreen(ABC):
     def __init__(self, font: PixelFont, ui: UIComponents) -> None:
         self.font = font
         self.ui = ui
+        # Set when the screen's content changed and it must be redrawn
+        self.dirty = True
+        # With dirty set: the only regions that changed, or None for all of it
+        self.dirty_rects: list[pygame.Rect] | None = None
+        # Static parts of the screen, rendered once by build_background()
+        self._bg: pygame.Surface | None = None
 
     @abstractmethod
     def draw(self, surface: pygame.Surface) -> None:
@@ -25,6 +32,25 @@ class BaseScreen(ABC):
         """Update screen with new data"""
         pass
 
+    def build_background(self, surface: pygame.Surface) -> None:
+        """Draw the parts of the screen that never change between frames.
+
+        Override in subclasses that call draw_background() from draw().
+        """
+        surface.fill(colors.BLACK())
+
+    def draw_background(self, surface: pygame.Surface) -> None:
+        """Blit the static background, building it on first use"""
+        if self._bg is None:
+            self._bg = pygame.Surface(surface.get_size()).convert()
+            self.build_background(self._bg)
+        surface.blit(self._bg, (0, 0))
+
+    def invalidate_background(self) -> None:
+        """Drop the static background, e.g. after a theme change"""
+        self._bg = None
+        self.dirty = True
+
     def handle_tap(self, pos: tuple[int, int]) -> dict | None:
         """Handle tap events. Override in subclasses that need tap handling."""
         return None
@@ -2,7 +2,7 @@
 
 import pygame
 
-from config import SCREEN_HEIGHT, SCREEN_WIDTH, Layout
+from config import SCREEN_HEIGHT, SCREEN_WIDTH, layout
 from ui import colors
 from ui.components import UIComponents
 from ui.fonts import PixelFont
@@ -21,27 +21,48 @@ class ClientsScreen(BaseScreen):
     def __init__(self, font: PixelFont, ui: UIComponents) -> None:
         super().__init__(font, ui)
         self.clients: dict[str, int] = {}
+        # (display name, count text, bar width) per shown row
+        self._rows: list[tuple[str, str, int]] = []
+        # Rendered (name, count) surfaces per row and the colors they used
+        self._row_texts: list[tuple[pygame.Surface, pygame.Surface]] = []
+        self._row_colors: tuple[tuple[int, int, int], ...] | None = None
 
     def update(self, data: dict) -> None:
         """Update with top clients data"""
         self.clients = data.get("clients", {})
 
+        # Truncation and bar scaling only change with the data
+        max_count = max(self.clients.values(), default=1) or 1
+        max_chars = layout.max_client_chars
+        self._rows = [
+            (
+                # Truncate long names - responsive to screen width
+                client if len(client) <= max_chars else client[: max_chars - 3] + "...",
+                str(count),
+                int((count / max_count) * layout.bar_max_width),
+            )
+            for client, count in list(self.clients.items())[:9]
+        ]
+        self._row_colors = None
+        self.dirty = True
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the clients screen"""
         surface.fill(colors.BLACK())
 
         # Title
-        title = self.font.medium.render("TOP CLIENTS", True, colors.YELLOW())
-        surface.blit(title, (Layout.title_x, Layout.title_y))
+        title = self.font.render_cached(
+            self.font.medium, "TOP CLIENTS", colors.YELLOW()
+        )
+        surface.blit(title, (layout.title_x, layout.title_y))
 
         if not self.clients:
-            text = self.font.medium.render("No data", True, colors.GRAY())
+            text = self.font.render_cached(self.font.medium, "No data", colors.GRAY())
             surface.blit(text, (SCREEN_WIDTH // 2 - 40, SCREEN_HEIGHT // 2))
             return
 
-        y = Layout.row_start_y
-        row_height = Layout.row_height_sm
-        max_count = max(self.clients.values()) if self.clients else 1
+        y = layout.row_start_y
+        row_height = layout.row_height_sm
 
         # Color coding for ranks
         rank_colors = [
@@ -56,39 +77,53 @@ class ClientsScreen(BaseScreen):
             colors.GRAY(),
         ]
 
-        for i, (client, count) in enumerate(list(self.clients.items())[:9]):
-            # Truncate long names - responsive to screen width
-            if len(client) > Layout.max_client_chars:
-                client = client[: Layout.max_client_chars - 3] + "..."
+        # Text only changes with the data or the theme, not per frame
+        name_color = colors.CYAN()
+        count_color = colors.WHITE()
+        if self._row_colors != (name_color, count_color):
+            small = self.font.small
+            self._row_texts = [
+                (
+                    small.render(client, True, name_color).convert_alpha(),
+                    small.render(count_str, True, count_color).convert_alpha(),
+                )
+                for client, count_str, _ in self._rows
+            ]
+            self._row_colors = (name_color, count_color)
 
+        # Row text is collected and blitted in one call after the loop
+        texts: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for i, (_, _, bar_width) in enumerate(self._rows):
             # Alternating row colors
             if i % 2 == 0:
                 pygame.draw.rect(
                     surface,
                     (20, 20, 20),
-                    (Layout.margin_sm, y, SCREEN_WIDTH - Layout.margin_sm * 2, row_height),
+                    (layout.margin_sm, y, SCREEN_WIDTH - layout.margin_sm * 2, row_height),
                     border_radius=_get_radius(),
                 )
 
             # Rank with color coding
-            rank_text = self.font.small.render(f"{i + 1}.", True, rank_colors[i])
-            surface.blit(rank_text, (Layout.rank_x, y + Layout.row_padding))
+            rank_text = self.font.render_cached(
+                self.font.small, f"{i + 1}.", rank_colors[i]
+            )
+            texts.append((rank_text, (layout.rank_x, y + layout.row_padding)))
 
             # Client name/IP
-            client_text = self.font.small.render(client, True, colors.CYAN())
-            surface.blit(client_text, (Layout.content_x, y + Layout.row_padding))
+            client_text, count_text = self._row_texts[i]
+            texts.append((client_text, (layout.content_x, y + layout.row_padding)))
 
             # Count text - right aligned before bar
-            count_text = self.font.small.render(str(count), True, colors.WHITE())
-            surface.blit(count_text, (Layout.count_x, y + Layout.row_padding))
+            texts.append((count_text, (layout.count_x, y + layout.row_padding)))
 
             # Query count bar - right side
-            bar_width = int((count / max_count) * Layout.bar_max_width)
             pygame.draw.rect(
                 surface,
                 colors.GREEN(),
-                (Layout.bar_x, y + Layout.row_padding, bar_width, Layout.bar_height_sm),
+                (layout.bar_x, y + layout.row_padding, bar_width, layout.bar_height_sm),
                 border_radius=_get_radius(),
             )
 
             y += row_height
+
+        surface.blits(texts, doreturn=False)
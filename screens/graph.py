@@ -1,8 +1,10 @@
 """Query graph screen"""
 
+from itertools import islice
+
 import pygame
 
-from config import SCREEN_HEIGHT, SCREEN_WIDTH, Layout
+from config import SCREEN_HEIGHT, SCREEN_WIDTH, layout
 from ui import colors
 from ui.components import UIComponents
 from ui.fonts import PixelFont
@@ -21,107 +23,134 @@ class GraphScreen(BaseScreen):
     def __init__(self, font: PixelFont, ui: UIComponents) -> None:
         super().__init__(font, ui)
         self.history: list[tuple[int, int]] = []  # (total, blocked) pairs
+        # Bar geometry for the current history, laid out once per update
+        self._max_val = 1
+        self._total_bars: list[pygame.Rect] = []
+        self._blocked_bars: list[pygame.Rect] = []
 
     def update(self, data: dict) -> None:
         """Update with overtime history data"""
         history_data = data.get("history", [])
-        self.history = []
-
-        for entry in history_data[-48:]:  # Last 48 entries (4 hours at 5min intervals)
-            total = entry.get("total", 0)
-            blocked = entry.get("blocked", 0)
-            self.history.append((total, blocked))
-
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the graph screen"""
-        surface.fill(colors.BLACK())
-
-        # Title
-        title = self.font.medium.render("QUERY HISTORY", True, colors.GREEN())
-        surface.blit(title, (Layout.title_x, Layout.title_y))
-
+        # Last 48 entries (4 hours at 5min intervals), read without slicing a copy
+        start = max(0, len(history_data) - 48)
+        self.history = [
+            (entry.get("total", 0), entry.get("blocked", 0))
+            for entry in islice(history_data, start, None)
+        ]
+        self._layout_bars()
+        self.dirty = True
+
+    def _layout_bars(self) -> None:
+        """Scale the history into bar rects; draw() only fills them"""
+        self._total_bars = []
+        self._blocked_bars = []
         if not self.history:
-            no_data = self.font.small.render("NO DATA", True, colors.GRAY())
-            surface.blit(no_data, (SCREEN_WIDTH // 2 - 30, SCREEN_HEIGHT // 2))
             return
 
-        # Graph area - uses Layout system
-        graph_x = Layout.graph_x
-        graph_y = Layout.graph_y
-        graph_width = Layout.graph_width
-        graph_height = Layout.graph_height
-
-        # Draw graph background
-        radius = 8 if colors.get_style() == "glow" else 0
-        pygame.draw.rect(
-            surface,
-            colors.DARK_GRAY(),
-            (graph_x, graph_y, graph_width, graph_height),
-            border_radius=radius,
-        )
+        graph_x = layout.graph_x
+        graph_bottom = layout.graph_y + layout.graph_height
+        graph_height = layout.graph_height
 
         # Find max value for scaling
-        max_val = max(max(t, b) for t, b in self.history) if self.history else 1
-        if max_val == 0:
-            max_val = 1
-
-        # Draw bars
-        bar_width = graph_width // len(self.history) if self.history else 1
+        max_val = self._max_val = max(max(t, b) for t, b in self.history) or 1
+        bar_width = layout.graph_width // len(self.history)
 
         for i, (total, blocked) in enumerate(self.history):
             x = graph_x + i * bar_width
-
-            # Total queries bar (green)
             total_height = int((total / max_val) * graph_height)
             if total_height > 0:
-                pygame.draw.rect(
-                    surface,
-                    colors.GREEN(),
-                    (
-                        x,
-                        graph_y + graph_height - total_height,
-                        bar_width - 1,
-                        total_height,
-                    ),
+                self._total_bars.append(
+                    pygame.Rect(
+                        x, graph_bottom - total_height, bar_width - 1, total_height
+                    )
                 )
-
-            # Blocked queries bar (red, overlaid)
             blocked_height = int((blocked / max_val) * graph_height)
             if blocked_height > 0:
-                pygame.draw.rect(
-                    surface,
-                    colors.RED(),
-                    (
-                        x,
-                        graph_y + graph_height - blocked_height,
-                        bar_width - 1,
-                        blocked_height,
-                    ),
+                self._blocked_bars.append(
+                    pygame.Rect(
+                        x, graph_bottom - blocked_height, bar_width - 1, blocked_height
+                    )
                 )
 
-        # Y-axis labels
-        max_label = self.font.tiny.render(str(max_val), True, colors.WHITE())
-        surface.blit(max_label, (graph_x - max_label.get_width() - Layout.margin_xs, graph_y))
+    def build_background(self, surface: pygame.Surface) -> None:
+        """Draw the title, graph area, zero label, legend and time label"""
+        surface.fill(colors.BLACK())
+
+        # Title
+        title = self.font.render_cached(
+            self.font.medium, "QUERY HISTORY", colors.GREEN()
+        )
+        surface.blit(title, (layout.title_x, layout.title_y))
+
+        # Graph area - uses layout system
+        graph_x = layout.graph_x
+        graph_y = layout.graph_y
+        graph_width = layout.graph_width
+        graph_height = layout.graph_height
 
-        zero_label = self.font.tiny.render("0", True, colors.WHITE())
+        # Draw graph background
+        radius = 8 if colors.get_style() == "glow" else 0
+        pygame.draw.rect(
+            surface,
+            colors.DARK_GRAY(),
+            (graph_x, graph_y, graph_width, graph_height),
+            border_radius=radius,
+        )
+
+        zero_label = self.font.render_cached(self.font.tiny, "0", colors.WHITE())
         surface.blit(
             zero_label,
-            (graph_x - zero_label.get_width() - Layout.margin_xs, graph_y + graph_height - Layout.margin_sm),
+            (graph_x - zero_label.get_width() - layout.margin_xs, graph_y + graph_height - layout.margin_sm),
         )
 
         # Legend - responsive positioning
-        legend_y = Layout.legend_y
-        legend_size = Layout.legend_box_size
-        pygame.draw.rect(surface, colors.GREEN(), (Layout.margin_sm, legend_y, legend_size, legend_size))
-        total_label = self.font.tiny.render("TOTAL", True, colors.WHITE())
-        surface.blit(total_label, (Layout.margin_sm + legend_size + Layout.margin_xs, legend_y))
+        legend_y = layout.legend_y
+        legend_size = layout.legend_box_size
+        pygame.draw.rect(surface, colors.GREEN(), (layout.margin_sm, legend_y, legend_size, legend_size))
+        total_label = self.font.render_cached(self.font.tiny, "TOTAL", colors.WHITE())
+        surface.blit(total_label, (layout.margin_sm + legend_size + layout.margin_xs, legend_y))
 
         # Position blocked legend relative to screen width
-        blocked_legend_x = Layout.margin_sm + legend_size + Layout.margin_xs + total_label.get_width() + Layout.legend_spacing
+        blocked_legend_x = layout.margin_sm + legend_size + layout.margin_xs + total_label.get_width() + layout.legend_spacing
         pygame.draw.rect(surface, colors.RED(), (blocked_legend_x, legend_y, legend_size, legend_size))
-        blocked_label = self.font.tiny.render("BLOCKED", True, colors.WHITE())
-        surface.blit(blocked_label, (blocked_legend_x + legend_size + Layout.margin_xs, legend_y))
+        blocked_label = self.font.render_cached(
+            self.font.tiny, "BLOCKED", colors.WHITE()
+        )
+        surface.blit(blocked_label, (blocked_legend_x + legend_size + layout.margin_xs, legend_y))
 
         # Time labels
-        time_label = self.font.tiny.render("LAST 4 HOURS", True, colors.WHITE())
+        time_label = self.font.render_cached(
+            self.font.tiny, "LAST 4 HOURS", colors.WHITE()
+        )
         surface.blit(time_label, (graph_x + graph_width - time_label.get_width(), legend_y))
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the graph screen"""
+        if not self.history:
+            surface.fill(colors.BLACK())
+            title = self.font.render_cached(
+                self.font.medium, "QUERY HISTORY", colors.GREEN()
+            )
+            surface.blit(title, (layout.title_x, layout.title_y))
+            no_data = self.font.render_cached(self.font.small, "NO DATA", colors.GRAY())
+            surface.blit(no_data, (SCREEN_WIDTH // 2 - 30, SCREEN_HEIGHT // 2))
+            return
+
+        self.draw_background(surface)
+
+        # Total queries bars (green), then blocked bars (red) overlaid on them;
+        # plain rects, so the fill fast path does what draw.rect would
+        fill = surface.fill
+        total_color = colors.GREEN()
+        for rect in self._total_bars:
+            fill(total_color, rect)
+        blocked_color = colors.RED()
+        for rect in self._blocked_bars:
+            fill(blocked_color, rect)
+
+        # Y-axis scale label
+        max_label = self.font.render_cached(
+            self.font.tiny, str(self._max_val), colors.WHITE()
+        )
+        max_x = layout.graph_x - max_label.get_width() - layout.margin_xs
+        surface.blit(max_label, (max_x, layout.graph_y))
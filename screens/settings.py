@@ -2,7 +2,7 @@
 
 import pygame
 
-from config import SCREEN_HEIGHT, SCREEN_WIDTH, VERSION, Layout
+from config import SCREEN_HEIGHT, SCREEN_WIDTH, VERSION, layout
 from ui import colors
 from ui.components import UIComponents
 from ui.fonts import PixelFont
@@ -42,8 +42,8 @@ class SettingsScreen(BaseScreen):
         # Lock state - settings locked by default
         self.locked = True
         self.lock_rect = pygame.Rect(
-            SCREEN_WIDTH - Layout.margin_lg * 2, Layout.margin_xs,
-            Layout.margin_lg + Layout.margin_sm, Layout.margin_lg
+            SCREEN_WIDTH - layout.margin_lg * 2, layout.margin_xs,
+            layout.margin_lg + layout.margin_sm, layout.margin_lg
         )
 
     def update(self, data: dict) -> None:
@@ -51,13 +51,16 @@ class SettingsScreen(BaseScreen):
         # Get current theme from data or default
         current_theme = data.get("current_theme", "default")
         if current_theme in self.themes:
-            self.current_theme_index = self.themes.index(current_theme)
+            theme_index = self.themes.index(current_theme)
+            if theme_index != self.current_theme_index:
+                self.current_theme_index = theme_index
+                self.dirty = True
 
     def _handle_arrow_tap(self, x: int, values: list, index: int) -> int:
         """Handle arrow tap for cycling through values"""
-        if x >= Layout.arrow_tap_left_start and x <= Layout.arrow_tap_left_end:
+        if x >= layout.arrow_tap_left_start and x <= layout.arrow_tap_left_end:
             return (index - 1) % len(values)
-        elif x >= Layout.arrow_tap_right_start:
+        elif x >= layout.arrow_tap_right_start:
             return (index + 1) % len(values)
         return index
 
@@ -74,9 +77,9 @@ class SettingsScreen(BaseScreen):
 
     def _handle_brightness_tap(self, x: int) -> dict:
         """Handle brightness option tap"""
-        if x >= Layout.arrow_tap_left_start and x <= Layout.arrow_tap_left_end:
+        if x >= layout.arrow_tap_left_start and x <= layout.arrow_tap_left_end:
             self.brightness = max(10, self.brightness - 10)
-        elif x >= Layout.arrow_tap_right_start:
+        elif x >= layout.arrow_tap_right_start:
             self.brightness = min(100, self.brightness + 10)
         return {"action": "set_brightness", "value": self.brightness}
 
@@ -103,6 +106,7 @@ class SettingsScreen(BaseScreen):
     def handle_tap(self, pos: tuple[int, int]) -> dict | None:
         """Handle tap events, return action dict if action needed"""
         x, y = pos
+        self.dirty = True  # Taps change lock, selection or values
 
         # Check if lock icon was tapped
         if self.lock_rect.collidepoint(pos):
@@ -156,20 +160,20 @@ class SettingsScreen(BaseScreen):
         surface.fill(colors.BLACK())
 
         # Title
-        title = self.font.medium.render("SETTINGS", True, colors.CYAN())
-        surface.blit(title, (Layout.title_x, Layout.title_y))
+        title = self.font.render_cached(self.font.medium, "SETTINGS", colors.CYAN())
+        surface.blit(title, (layout.title_x, layout.title_y))
 
         # Lock icon in top right (before version)
-        lock_x = SCREEN_WIDTH - Layout.margin_lg - Layout.margin_sm
-        lock_y = Layout.margin_md
-        lock_body_w = max(12, int(16 * Layout.scale_x))
-        lock_body_h = max(9, int(12 * Layout.scale_y))
+        lock_x = SCREEN_WIDTH - layout.margin_lg - layout.margin_sm
+        lock_y = layout.margin_md
+        lock_body_w = max(12, int(16 * layout.scale_x))
+        lock_body_h = max(9, int(12 * layout.scale_y))
         lock_color = colors.RED() if self.locked else colors.GREEN()
         # Draw lock body
         pygame.draw.rect(surface, lock_color, (lock_x, lock_y, lock_body_w, lock_body_h))
         # Draw lock shackle (arch)
-        shackle_w = max(9, int(12 * Layout.scale_x))
-        shackle_h = max(9, int(12 * Layout.scale_y))
+        shackle_w = max(9, int(12 * layout.scale_x))
+        shackle_h = max(9, int(12 * layout.scale_y))
         if self.locked:
             # Closed shackle
             pygame.draw.arc(
@@ -181,33 +185,35 @@ class SettingsScreen(BaseScreen):
             # Open shackle (shifted right)
             pygame.draw.arc(
                 surface, lock_color,
-                (lock_x + Layout.margin_xs, lock_y - shackle_h + 3, shackle_w, shackle_h),
+                (lock_x + layout.margin_xs, lock_y - shackle_h + 3, shackle_w, shackle_h),
                 0, 3.14, 2
             )
 
         # Version below lock
-        version_text = self.font.tiny.render(f"v{VERSION}", True, colors.GRAY())
-        surface.blit(version_text, (SCREEN_WIDTH - version_text.get_width() - Layout.margin_sm, lock_y + lock_body_h + 3))
+        version_text = self.font.render_cached(
+            self.font.tiny, f"v{VERSION}", colors.GRAY()
+        )
+        surface.blit(version_text, (SCREEN_WIDTH - version_text.get_width() - layout.margin_sm, lock_y + lock_body_h + 3))
 
-        y = Layout.row_start_y
-        row_height = Layout.row_height_md
-        row_spacing = Layout.margin_xs
+        y = layout.row_start_y
+        row_height = layout.row_height_md
+        row_spacing = layout.margin_xs
         self.option_rects = []
 
         # Responsive positioning for arrows and values
-        left_arrow_x = Layout.arrow_left_x
-        value_start_x = Layout.value_x
-        right_arrow_x = Layout.arrow_right_x
+        left_arrow_x = layout.arrow_left_x
+        value_start_x = layout.value_x
+        right_arrow_x = layout.arrow_right_x
         arrow_v_offset = row_height // 2
-        arrow_half_h = Layout.arrow_half_height
-        arrow_w = Layout.arrow_width
+        arrow_half_h = layout.arrow_half_height
+        arrow_w = layout.arrow_width
         text_v_offset = int(row_height * 0.32)
 
         # Helper to draw a setting row
         def draw_row(label: str, value: str, has_arrows: bool = True) -> None:
             nonlocal y
-            row_width = SCREEN_WIDTH - Layout.margin_md * 2
-            option_rect = pygame.Rect(Layout.rank_x, y, row_width, row_height)
+            row_width = SCREEN_WIDTH - layout.margin_md * 2
+            option_rect = pygame.Rect(layout.rank_x, y, row_width, row_height)
             self.option_rects.append(option_rect)
 
             idx = len(self.option_rects) - 1
@@ -218,14 +224,14 @@ class SettingsScreen(BaseScreen):
             pygame.draw.rect(
                 surface,
                 border_color,
-                (Layout.rank_x, y, row_width, row_height),
+                (layout.rank_x, y, row_width, row_height),
                 1,
                 border_radius=_get_radius(),
             )
 
             # Label
-            label_text = self.font.small.render(label, True, border_color)
-            surface.blit(label_text, (Layout.margin_lg, y + text_v_offset))
+            label_text = self.font.render_cached(self.font.small, label, border_color)
+            surface.blit(label_text, (layout.margin_lg, y + text_v_offset))
 
             if has_arrows:
                 arrow_color = colors.WHITE() if is_selected else colors.GRAY()
@@ -246,13 +252,17 @@ class SettingsScreen(BaseScreen):
                     ]
                 )
                 # Value centered between arrows
-                value_text = self.font.small.render(value, True, colors.WHITE())
+                value_text = self.font.render_cached(
+                    self.font.small, value, colors.WHITE()
+                )
                 value_area_width = right_arrow_x - arrow_w - value_start_x
                 text_x = value_start_x + (value_area_width - value_text.get_width()) // 2
                 surface.blit(value_text, (text_x, y + text_v_offset))
             else:
                 # Toggle - center value like other settings
-                value_text = self.font.small.render(value, True, colors.WHITE())
+                value_text = self.font.render_cached(
+                    self.font.small, value, colors.WHITE()
+                )
                 value_area_width = right_arrow_x - arrow_w - value_start_x
                 text_x = value_start_x + (value_area_width - value_text.get_width()) // 2
                 surface.blit(value_text, (text_x, y + text_v_offset))
@@ -285,8 +295,12 @@ class SettingsScreen(BaseScreen):
 
         # Instructions at bottom
         if self.locked:
-            hint = self.font.tiny.render("TAP LOCK TO EDIT", True, colors.GRAY())
+            hint = self.font.render_cached(
+                self.font.tiny, "TAP LOCK TO EDIT", colors.GRAY()
+            )
         else:
-            hint = self.font.tiny.render("TAP TO CHANGE", True, colors.GRAY())
-        hint_y = SCREEN_HEIGHT - Layout.header_height
+            hint = self.font.render_cached(
+                self.font.tiny, "TAP TO CHANGE", colors.GRAY()
+            )
+        hint_y = SCREEN_HEIGHT - layout.header_height
         surface.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, hint_y))
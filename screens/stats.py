@@ -1,17 +1,29 @@
 """Pi-hole statistics screen"""
 
 import math
-import subprocess
 
 import pygame
 
-from config import SCREEN_HEIGHT, SCREEN_WIDTH, Layout
+from config import SCREEN_HEIGHT, SCREEN_WIDTH, layout
 from ui import colors
 from ui.components import UIComponents
 from ui.fonts import PixelFont
 
 from .base import BaseScreen
 
+# Whole-pixel growth of the status dot for each animation_offset (0-359)
+_PULSE_LUT = tuple(int(abs(math.sin(i * 0.1)) * 3) for i in range(360))
+
+# Vertical spacing based on screen height
+_TITLE_Y = int(SCREEN_HEIGHT * 0.03)
+_ROW1_Y = int(SCREEN_HEIGHT * 0.125)
+_ROW1_BOX_H = int(SCREEN_HEIGHT * 0.20)
+_ROW2_Y = int(SCREEN_HEIGHT * 0.375)
+_ROW3_Y = int(SCREEN_HEIGHT * 0.547)
+_ROW3_BOX_H = int(SCREEN_HEIGHT * 0.172)
+_ROW4_Y = int(SCREEN_HEIGHT * 0.766)
+_ROW4_BOX_H = int(SCREEN_HEIGHT * 0.156)
+
 
 def _draw_border(
     ui: UIComponents,
@@ -86,6 +98,16 @@ class StatsScreen(BaseScreen):
         self.clients = 0
         self.domains_blocked = 0
         self.status = "enabled"
+        self.dns_ip = "N/A"
+        # Everything draw() shows, as of the last frame marked dirty
+        self._shown: tuple | None = None
+        # Areas of the two counter boxes and the pulsing status dot, matching
+        # the first three entries of _shown; known after the first draw
+        self._regions: tuple[pygame.Rect, pygame.Rect, pygame.Rect] | None = None
+        # Last rendered value text per slot: (text, color, surface)
+        self._value_texts: dict[
+            str, tuple[str, tuple[int, int, int], pygame.Surface]
+        ] = {}
 
     def update(self, data: dict) -> None:
         """Update with Pi-hole summary data"""
@@ -95,114 +117,182 @@ class StatsScreen(BaseScreen):
         self.clients = data.get("unique_clients", 0)
         self.domains_blocked = data.get("domains_being_blocked", 0)
         self.status = data.get("status", "enabled")
+        self.dns_ip = data.get("dns_ip", "N/A")
 
         # Smooth counter animation
         self.displayed_queries += (self.total_queries - self.displayed_queries) * 0.1
         self.displayed_blocked += (self.blocked - self.displayed_blocked) * 0.1
         self.animation_offset = (self.animation_offset + 1) % 360
 
+        # Counters render as whole numbers and the status dot grows by whole
+        # pixels, so most animation steps leave the pixels unchanged
+        shown = (
+            int(self.displayed_queries),
+            int(self.displayed_blocked),
+            _PULSE_LUT[self.animation_offset],
+            self.percent_blocked,
+            self.clients,
+            self.domains_blocked,
+            self.status,
+            self.dns_ip,
+        )
+        if shown != self._shown:
+            # Animation-only steps need just the counter boxes / dot pushed
+            rects = None
+            if (
+                self._regions is not None
+                and self._shown is not None
+                and shown[3:] == self._shown[3:]
+            ):
+                rects = [
+                    rect
+                    for rect, old, new in zip(
+                        self._regions, self._shown[:3], shown[:3], strict=True
+                    )
+                    if old != new
+                ]
+            if not self.dirty:
+                self.dirty_rects = rects
+            elif rects is None or self.dirty_rects is None:
+                self.dirty_rects = None
+            else:
+                # Union with the pending regions, so steps taken while another
+                # screen is shown can't grow the list past the three regions
+                pending = self.dirty_rects
+                pending.extend([rect for rect in rects if rect not in pending])
+            self._shown = shown
+            self.dirty = True
+
+    def build_background(self, surface: pygame.Surface) -> None:
+        """Draw the title, the boxes whose color never changes and all labels"""
+        surface.fill(colors.BLACK())
+        margin = layout.box_margin
+        box_width = layout.box_width
+        right_x = layout.box_right_x
+        label_offset_y = layout.padding_sm
+
+        # Title
+        title = self.font.render_cached(self.font.medium, "PI-HOLE", colors.GREEN())
+        surface.blit(title, (margin, _TITLE_Y))
+
+        boxes = (
+            (margin, _ROW1_Y, _ROW1_BOX_H, "QUERIES", colors.GREEN()),
+            (right_x, _ROW1_Y, _ROW1_BOX_H, "BLOCKED", colors.RED()),
+            (margin, _ROW3_Y, _ROW3_BOX_H, "CLIENTS", colors.YELLOW()),
+            (right_x, _ROW3_Y, _ROW3_BOX_H, "BLOCKLIST", colors.PURPLE()),
+            (right_x, _ROW4_Y, _ROW4_BOX_H, "DNS", colors.CYAN()),
+        )
+        for x, y, height, label, color in boxes:
+            _draw_border(self.ui, surface, pygame.Rect(x, y, box_width, height), color)
+            text = self.font.render_cached(self.font.small, label, color)
+            surface.blit(text, (x + layout.box_padding_x, y + label_offset_y))
+
+        text = self.font.render_cached(self.font.small, "BLOCK RATE", colors.CYAN())
+        surface.blit(text, (margin, _ROW2_Y))
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the stats screen"""
-        surface.fill(colors.BLACK())
+        self.draw_background(surface)
 
-        # Use Layout system for responsive dimensions
-        margin = Layout.box_margin
-        box_width = Layout.box_width
-        right_x = Layout.box_right_x
+        # Use layout system for responsive dimensions
+        margin = layout.box_margin
+        box_width = layout.box_width
+        right_x = layout.box_right_x
         bar_width = int(SCREEN_WIDTH * 0.77)  # Bar width for block rate
-        percent_x = margin + bar_width + Layout.margin_sm
-
-        # Vertical spacing based on screen height
-        title_y = int(SCREEN_HEIGHT * 0.03)
-        row1_y = int(SCREEN_HEIGHT * 0.125)
-        row1_box_h = int(SCREEN_HEIGHT * 0.20)
-        row2_y = int(SCREEN_HEIGHT * 0.375)
+        percent_x = margin + bar_width + layout.margin_sm
         bar_height = int(SCREEN_HEIGHT * 0.078)
-        row3_y = int(SCREEN_HEIGHT * 0.547)
-        row3_box_h = int(SCREEN_HEIGHT * 0.172)
-        row4_y = int(SCREEN_HEIGHT * 0.766)
-        row4_box_h = int(SCREEN_HEIGHT * 0.156)
 
         # Text offsets within boxes
-        label_offset_y = Layout.padding_sm
-        value_offset_y = Layout.box_text_offset
-
-        # Title
-        title = self.font.medium.render("PI-HOLE", True, colors.GREEN())
-        surface.blit(title, (margin, title_y))
+        label_offset_y = layout.padding_sm
+        value_offset_y = layout.box_text_offset
 
         # Total Queries box
-        _draw_border(self.ui, surface, pygame.Rect(margin, row1_y, box_width, row1_box_h), colors.GREEN())
-        text = self.font.small.render("QUERIES", True, colors.GREEN())
-        surface.blit(text, (margin + Layout.box_padding_x, row1_y + label_offset_y))
-        num = self.font.large.render(
-            f"{int(self.displayed_queries)}", True, colors.WHITE()
+        queries_rect = pygame.Rect(margin, _ROW1_Y, box_width, _ROW1_BOX_H)
+        # The animated counters change most frames: compose them from glyphs
+        self.font.blit_glyphs(
+            surface,
+            self.font.large,
+            f"{int(self.displayed_queries)}",
+            colors.WHITE(),
+            (margin + layout.box_padding_x, _ROW1_Y + value_offset_y),
         )
-        surface.blit(num, (margin + Layout.box_padding_x, row1_y + value_offset_y))
 
         # Blocked box
-        _draw_border(self.ui, surface, pygame.Rect(right_x, row1_y, box_width, row1_box_h), colors.RED())
-        text = self.font.small.render("BLOCKED", True, colors.RED())
-        surface.blit(text, (right_x + Layout.box_padding_x, row1_y + label_offset_y))
-        num = self.font.large.render(
-            f"{int(self.displayed_blocked)}", True, colors.WHITE()
+        blocked_rect = pygame.Rect(right_x, _ROW1_Y, box_width, _ROW1_BOX_H)
+        self.font.blit_glyphs(
+            surface,
+            self.font.large,
+            f"{int(self.displayed_blocked)}",
+            colors.WHITE(),
+            (right_x + layout.box_padding_x, _ROW1_Y + value_offset_y),
         )
-        surface.blit(num, (right_x + Layout.box_padding_x, row1_y + value_offset_y))
 
         # Block percentage with bar
-        text = self.font.small.render("BLOCK RATE", True, colors.CYAN())
-        surface.blit(text, (margin, row2_y))
         _draw_bar(
-            self.ui, surface, margin, row2_y + Layout.padding_lg, bar_width, bar_height, self.percent_blocked, colors.CYAN()
+            self.ui,
+            surface,
+            margin,
+            _ROW2_Y + layout.padding_lg,
+            bar_width,
+            bar_height,
+            self.percent_blocked,
+            colors.CYAN(),
         )
-        percent_text = self.font.medium.render(
-            f"{self.percent_blocked:.1f}%", True, colors.WHITE()
+        percent_text = self._render_value(
+            "percent", self.font.medium, f"{self.percent_blocked:.1f}%", colors.WHITE()
         )
-        surface.blit(percent_text, (percent_x, row2_y + Layout.padding_lg))
+        surface.blit(percent_text, (percent_x, _ROW2_Y + layout.padding_lg))
 
         # Clients box
-        _draw_border(self.ui, surface, pygame.Rect(margin, row3_y, box_width, row3_box_h), colors.YELLOW())
-        text = self.font.small.render("CLIENTS", True, colors.YELLOW())
-        surface.blit(text, (margin + Layout.box_padding_x, row3_y + label_offset_y))
-        num = self.font.medium.render(f"{self.clients}", True, colors.WHITE())
-        surface.blit(num, (margin + Layout.box_padding_x, row3_y + value_offset_y))
+        num = self._render_value(
+            "clients", self.font.medium, f"{self.clients}", colors.WHITE()
+        )
+        surface.blit(num, (margin + layout.box_padding_x, _ROW3_Y + value_offset_y))
 
         # Blocklist box
-        _draw_border(self.ui, surface, pygame.Rect(right_x, row3_y, box_width, row3_box_h), colors.PURPLE())
-        text = self.font.small.render("BLOCKLIST", True, colors.PURPLE())
-        surface.blit(text, (right_x + Layout.box_padding_x, row3_y + label_offset_y))
         domains_str = self._format_number(self.domains_blocked)
-        num = self.font.medium.render(domains_str, True, colors.WHITE())
-        surface.blit(num, (right_x + Layout.box_padding_x, row3_y + value_offset_y))
+        num = self._render_value(
+            "domains", self.font.medium, domains_str, colors.WHITE()
+        )
+        surface.blit(num, (right_x + layout.box_padding_x, _ROW3_Y + value_offset_y))
 
-        # Status box
+        # Status box, colored by the blocking state
         status_color = colors.GREEN() if self.status == "enabled" else colors.RED()
-        _draw_border(self.ui, surface, pygame.Rect(margin, row4_y, box_width, row4_box_h), status_color)
-        text = self.font.small.render("STATUS", True, status_color)
-        surface.blit(text, (margin + Layout.box_padding_x, row4_y + label_offset_y))
+        status_rect = pygame.Rect(margin, _ROW4_Y, box_width, _ROW4_BOX_H)
+        _draw_border(self.ui, surface, status_rect, status_color)
+        text = self.font.render_cached(self.font.small, "STATUS", status_color)
+        surface.blit(text, (margin + layout.box_padding_x, _ROW4_Y + label_offset_y))
         # Pulsing dot + status text
-        pulse = abs(math.sin(self.animation_offset * 0.1)) * 3
-        dot_size = max(6, int(8 * Layout.scale_min))
+        pulse = _PULSE_LUT[self.animation_offset]
+        dot_size = max(6, int(8 * layout.scale_min))
+        dot_rect = pygame.Rect(
+            margin + layout.box_padding_x, _ROW4_Y + value_offset_y, dot_size + 3, dot_size + 3
+        )
+        self._regions = (queries_rect, blocked_rect, dot_rect)
         pygame.draw.rect(
-            surface, status_color, (margin + Layout.box_padding_x, row4_y + value_offset_y, int(dot_size + pulse), int(dot_size + pulse))
+            surface, status_color, (margin + layout.box_padding_x, _ROW4_Y + value_offset_y, dot_size + pulse, dot_size + pulse)
+        )
+        status_text = self._render_value(
+            "status", self.font.medium, self.status.upper(), colors.WHITE()
         )
-        status_text = self.font.medium.render(self.status.upper(), True, colors.WHITE())
-        surface.blit(status_text, (margin + Layout.box_padding_x + dot_size + Layout.margin_md, row4_y + value_offset_y - 3))
+        surface.blit(status_text, (margin + layout.box_padding_x + dot_size + layout.margin_md, _ROW4_Y + value_offset_y - 3))
 
         # DNS box
-        _draw_border(self.ui, surface, pygame.Rect(right_x, row4_y, box_width, row4_box_h), colors.CYAN())
-        text = self.font.small.render("DNS", True, colors.CYAN())
-        surface.blit(text, (right_x + Layout.box_padding_x, row4_y + label_offset_y))
-        # Get IP dynamically
-        try:
-            result = subprocess.run(
-                ["hostname", "-I"], capture_output=True, text=True, timeout=1
-            )
-            ip = result.stdout.strip().split()[0] if result.stdout.strip() else "N/A"
-        except Exception:
-            ip = "N/A"
-        dns_text = self.font.medium.render(ip, True, colors.WHITE())
-        surface.blit(dns_text, (right_x + Layout.box_padding_x, row4_y + value_offset_y - 3))
+        dns_text = self._render_value(
+            "dns", self.font.medium, self.dns_ip, colors.WHITE()
+        )
+        surface.blit(dns_text, (right_x + layout.box_padding_x, _ROW4_Y + value_offset_y - 3))
+
+    def _render_value(
+        self, slot: str, font: pygame.font.Font, text: str, color: tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Render a value's text, reusing the last surface while it is unchanged"""
+        cached = self._value_texts.get(slot)
+        if cached is not None and cached[0] == text and cached[1] == color:
+            return cached[2]
+        surface = font.render(text, True, color).convert_alpha()
+        self._value_texts[slot] = (text, color, surface)
+        return surface
 
     def _format_number(self, num: int) -> str:
         """Format large numbers with K/M suffix"""
@@ -1,11 +1,11 @@
 """System information screen"""
 
-import shutil
+import time
 from datetime import datetime
 
 import pygame
 
-from config import SCREEN_HEIGHT, SCREEN_WIDTH, Layout
+from config import SCREEN_HEIGHT, SCREEN_WIDTH, layout
 from ui import colors
 from ui.components import UIComponents
 from ui.fonts import PixelFont
@@ -13,6 +13,13 @@ from utils.system_info import SystemInfo
 
 from .base import BaseScreen
 
+# Row positions, scaled from the screen height
+_DISK_Y = int(SCREEN_HEIGHT * 0.172)
+_BOX_HEIGHT = int(SCREEN_HEIGHT * 0.156)
+_ROW1_Y = int(SCREEN_HEIGHT * 0.297)
+_ROW2_Y = int(SCREEN_HEIGHT * 0.5)
+_BARS_Y = int(SCREEN_HEIGHT * 0.703)
+
 
 def _draw_border(
     ui: UIComponents,
@@ -78,10 +85,25 @@ class SystemScreen(BaseScreen):
     def __init__(self, font: PixelFont, ui: UIComponents) -> None:
         super().__init__(font, ui)
         self.system_info = SystemInfo()
+        # SystemInfo.last_update as of the values last marked for drawing
+        self._seen_update = float("-inf")
+        # Wall-clock time at which the shown HH:MM goes stale
+        self._next_minute = 0.0
+        # Rendered clock: ((time text, colors), time surface, date surface)
+        self._clock: tuple[tuple, pygame.Surface, pygame.Surface] | None = None
 
     def update(self, data: dict) -> None:
         """Update system information"""
+        # Only signals the background poller; its fetches land in last_update
         self.system_info.update()
+        last_update = self.system_info.last_update
+        # Time zones are offset by whole minutes, so local minutes roll over
+        # with epoch minutes; no need to format the time on every step
+        now = time.time()
+        if last_update != self._seen_update or now >= self._next_minute:
+            self._seen_update = last_update
+            self._next_minute = now - now % 60 + 60
+            self.dirty = True
 
     def _get_threshold_color(
         self, value: float, thresholds: tuple[float, float]
@@ -99,62 +121,69 @@ class SystemScreen(BaseScreen):
 
     def _draw_header(self, surface: pygame.Surface) -> None:
         """Draw hostname, IP, date and time"""
-        margin = Layout.margin_sm
+        margin = layout.margin_sm
         time_x = SCREEN_WIDTH - int(SCREEN_WIDTH * 0.21)
 
         info = self.system_info
-        title = self.font.medium.render(info.hostname.upper(), True, colors.CYAN())
-        surface.blit(title, (margin, Layout.title_y))
+        title = self.font.render_cached(
+            self.font.medium, info.hostname.upper(), colors.CYAN()
+        )
+        surface.blit(title, (margin, layout.title_y))
 
-        ip_text = self.font.tiny.render(info.ip_address, True, colors.GRAY())
-        surface.blit(ip_text, (margin, Layout.title_y + Layout.padding_lg + Layout.margin_xs))
+        ip_text = self.font.render_cached(
+            self.font.tiny, info.ip_address, colors.GRAY()
+        )
+        surface.blit(ip_text, (margin, layout.title_y + layout.padding_lg + layout.margin_xs))
 
+        # The clock only changes once a minute; reuse it across info refreshes
         now = datetime.now()
-        time_text = self.font.large.render(now.strftime("%H:%M"), True, colors.WHITE())
-        surface.blit(time_text, (time_x, Layout.title_y))
-        date_text = self.font.tiny.render(now.strftime("%a %d %b"), True, colors.GRAY())
-        surface.blit(date_text, (time_x, Layout.title_y + Layout.padding_lg + Layout.margin_xs))
+        clock_key = (now.strftime("%H:%M"), colors.WHITE(), colors.GRAY())
+        if self._clock is None or self._clock[0] != clock_key:
+            time_text = self.font.large.render(clock_key[0], True, clock_key[1])
+            date = now.strftime("%a %d %b")
+            date_text = self.font.tiny.render(date, True, clock_key[2])
+            self._clock = (
+                clock_key,
+                time_text.convert_alpha(),
+                date_text.convert_alpha(),
+            )
+        _, time_text, date_text = self._clock
+        surface.blit(time_text, (time_x, layout.title_y))
+        surface.blit(date_text, (time_x, layout.title_y + layout.padding_lg + layout.margin_xs))
 
     def _draw_disk_bar(self, surface: pygame.Surface, y: int) -> None:
         """Draw disk usage bar"""
-        margin = Layout.box_margin
+        margin = layout.box_margin
         label_width = int(SCREEN_WIDTH * 0.09)
         bar_width = int(SCREEN_WIDTH * 0.70)
-        info_x = margin + label_width + bar_width + Layout.margin_sm
-
-        text = self.font.small.render("DISK", True, colors.GRAY())
-        surface.blit(text, (margin, y + Layout.padding_xs))
-        try:
-            total, used, _ = shutil.disk_usage("/")
-            disk_percent = (used / total) * 100
-            disk_text = f"{used // (1024**3)}G/{total // (1024**3)}G"
-        except Exception:
+        info_x = margin + label_width + bar_width + layout.margin_sm
+
+        # Refreshed with the rest of the system info, not on every draw
+        info = self.system_info
+        if info.disk_total > 0:
+            disk_percent = info.disk_percent
+            disk_text = f"{int(info.disk_used)}G/{int(info.disk_total)}G"
+        else:
             disk_percent = 0
             disk_text = "N/A"
         bar_height = int(SCREEN_HEIGHT * 0.069)
         _draw_bar(self.ui, surface, margin + label_width, y, bar_width, bar_height, disk_percent, colors.GRAY())
-        disk_info = self.font.small.render(disk_text, True, colors.WHITE())
-        surface.blit(disk_info, (info_x, y + Layout.padding_xs))
+        disk_info = self.font.render_cached(self.font.small, disk_text, colors.WHITE())
+        surface.blit(disk_info, (info_x, y + layout.padding_xs))
 
     def _draw_info_boxes(self, surface: pygame.Surface) -> None:
         """Draw temp, memory, uptime and fan boxes"""
         info = self.system_info
 
-        # Use Layout system for responsive dimensions
-        margin = Layout.box_margin
-        box_width = Layout.box_width
-        right_x = Layout.box_right_x
-        box_height = int(SCREEN_HEIGHT * 0.156)
-        row1_y = int(SCREEN_HEIGHT * 0.297)
-        row2_y = int(SCREEN_HEIGHT * 0.5)
-
-        label_offset_y = Layout.padding_lg
-        value_offset_y = Layout.padding_md
+        # Use layout system for responsive dimensions
+        margin = layout.box_margin
+        box_width = layout.box_width
+        right_x = layout.box_right_x
+        row1_y = _ROW1_Y
+        row2_y = _ROW2_Y
+        value_offset_y = layout.padding_md
 
         # Temperature box
-        _draw_border(self.ui, surface, pygame.Rect(margin, row1_y, box_width, box_height), colors.ORANGE())
-        text = self.font.small.render("TEMP", True, colors.ORANGE())
-        surface.blit(text, (margin + Layout.box_padding_x, row1_y + label_offset_y))
         temp_color = self._get_threshold_color(info.temp, (60, 75))
         fahr_temp = (info.temp * 9/5) + 32
         temp_text = self.font.large.render(
@@ -165,27 +194,18 @@ class SystemScreen(BaseScreen):
         surface.blit(temp_text, (center_x, row1_y + value_offset_y))
 
         # Memory box
-        _draw_border(self.ui, surface, pygame.Rect(right_x, row1_y, box_width, box_height), colors.CYAN())
-        text = self.font.small.render("MEM", True, colors.CYAN())
-        surface.blit(text, (right_x + Layout.box_padding_x, row1_y + label_offset_y))
         mem_text = self.font.large.render(
             f"{info.mem_used:.0f}/{info.mem_total:.0f}", True, colors.WHITE()
         )
         surface.blit(mem_text, (right_x + int(box_width * 0.27), row1_y + value_offset_y))
 
         # Uptime box
-        _draw_border(self.ui, surface, pygame.Rect(margin, row2_y, box_width, box_height), colors.GREEN())
-        text = self.font.small.render("UP", True, colors.GREEN())
-        surface.blit(text, (margin + Layout.box_padding_x, row2_y + label_offset_y))
         uptime_text = self.font.large.render(
             info.uptime if info.uptime else "...", True, colors.WHITE()
         )
         surface.blit(uptime_text, (margin + int(box_width * 0.34), row2_y + value_offset_y))
 
         # Fan box
-        _draw_border(self.ui, surface, pygame.Rect(right_x, row2_y, box_width, box_height), colors.YELLOW())
-        text = self.font.small.render("FAN", True, colors.YELLOW())
-        surface.blit(text, (right_x + Layout.box_padding_x, row2_y + label_offset_y))
         fan_percent = int((info.fan_speed / 255) * 100)
         fan_color = colors.WHITE() if fan_percent > 0 else colors.GRAY()
         fan_text = self.font.large.render(f"{fan_percent}%", True, fan_color)
@@ -195,20 +215,16 @@ class SystemScreen(BaseScreen):
         """Draw CPU and RAM bars"""
         info = self.system_info
 
-        # Use Layout system for responsive dimensions
-        margin = Layout.box_margin
-        section_width = Layout.box_width
-        right_x = Layout.box_right_x
-        y = int(SCREEN_HEIGHT * 0.703)
-        bar_height = Layout.bar_height_lg
+        # Use layout system for responsive dimensions
+        margin = layout.box_margin
+        section_width = layout.box_width
+        right_x = layout.box_right_x
+        y = _BARS_Y
+        bar_height = layout.bar_height_lg
         bar_width = int(section_width * 0.91)
         label_offset = int(section_width * 0.07)
-        char_spacing = max(12, int(15 * Layout.scale_y))
 
         # CPU
-        for i, char in enumerate("CPU"):
-            text = self.font.small.render(char, True, colors.GREEN())
-            surface.blit(text, (margin, y + Layout.padding_sm + i * char_spacing))
         cpu_color = self._get_threshold_color(info.cpu_percent, (70, 90))
         _draw_bar(self.ui, surface, margin + label_offset, y, bar_width, bar_height, info.cpu_percent, cpu_color)
         percent_text = self.font.medium.render(
@@ -217,9 +233,6 @@ class SystemScreen(BaseScreen):
         surface.blit(percent_text, (margin + label_offset + bar_width // 2 - percent_text.get_width() // 2, y + bar_height // 2 - 8))
 
         # RAM
-        for i, char in enumerate("RAM"):
-            text = self.font.small.render(char, True, colors.PURPLE())
-            surface.blit(text, (right_x, y + Layout.padding_sm + i * char_spacing))
         ram_color = (
             colors.PURPLE()
             if info.mem_percent < 70
@@ -233,11 +246,43 @@ class SystemScreen(BaseScreen):
         )
         surface.blit(percent_text, (right_x + label_offset + bar_width // 2 - percent_text.get_width() // 2, y + bar_height // 2 - 8))
 
+    def build_background(self, surface: pygame.Surface) -> None:
+        """Draw the info box borders and every fixed label"""
+        surface.fill(colors.BLACK())
+        margin = layout.box_margin
+        box_width = layout.box_width
+        right_x = layout.box_right_x
+        label_offset_y = layout.padding_lg
+
+        text = self.font.render_cached(self.font.small, "DISK", colors.GRAY())
+        surface.blit(text, (margin, _DISK_Y + layout.padding_xs))
+
+        boxes = (
+            (margin, _ROW1_Y, "TEMP", colors.ORANGE()),
+            (right_x, _ROW1_Y, "MEM", colors.CYAN()),
+            (margin, _ROW2_Y, "UP", colors.GREEN()),
+            (right_x, _ROW2_Y, "FAN", colors.YELLOW()),
+        )
+        for x, y, label, color in boxes:
+            rect = pygame.Rect(x, y, box_width, _BOX_HEIGHT)
+            _draw_border(self.ui, surface, rect, color)
+            text = self.font.render_cached(self.font.small, label, color)
+            surface.blit(text, (x + layout.box_padding_x, y + label_offset_y))
+
+        # Vertical CPU / RAM labels beside the resource bars
+        char_spacing = max(12, int(15 * layout.scale_y))
+        for x, label, color in (
+            (margin, "CPU", colors.GREEN()),
+            (right_x, "RAM", colors.PURPLE()),
+        ):
+            for i, char in enumerate(label):
+                text = self.font.render_cached(self.font.small, char, color)
+                surface.blit(text, (x, _BARS_Y + layout.padding_sm + i * char_spacing))
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the system screen"""
-        surface.fill(colors.BLACK())
+        self.draw_background(surface)
         self._draw_header(surface)
-        disk_y = int(SCREEN_HEIGHT * 0.172)
-        self._draw_disk_bar(surface, disk_y)
+        self._draw_disk_bar(surface, _DISK_Y)
         self._draw_info_boxes(surface)
         self._draw_resource_bars(surface)
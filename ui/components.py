@@ -10,8 +10,21 @@ from .fonts import PixelFont
 class UIComponents:
     """Collection of reusable UI drawing functions"""
 
+    # Chunky bar segment geometry
+    _SEGMENT_WIDTH = 6
+    _SEGMENT_GAP = 2
+
     def __init__(self, font: PixelFont) -> None:
         self.font = font
+        # Pre-drawn scanline overlays keyed by (surface size, alpha)
+        self._scanlines: dict[tuple[tuple[int, int], int], pygame.Surface] = {}
+        # Screen indicator dot rects keyed by (surface width, total, y)
+        self._indicator_rects: dict[tuple[int, int, int], list[pygame.Rect]] = {}
+        # Chunky bar segment strips keyed by
+        # (width, height, background color, segment color)
+        self._chunky_strips: dict[
+            tuple[int, int, tuple[int, int, int], tuple[int, int, int]], pygame.Surface
+        ] = {}
 
     def _interpolate_color(
         self, color1: tuple[int, int, int], color2: tuple[int, int, int], factor: float
@@ -260,34 +273,49 @@ class UIComponents:
             bg_color = colors.DARK_GRAY()
 
         # Chunky segments - calculate how many fit
-        segment_width = 6
-        segment_gap = 2
+        segment_width = self._SEGMENT_WIDTH
+        segment_gap = self._SEGMENT_GAP
         total_segment_size = segment_width + segment_gap
         num_segments = width // total_segment_size
 
         # Actual width used by segments (last segment has no gap after it)
         actual_width = num_segments * segment_width + (num_segments - 1) * segment_gap
 
-        # Background matches actual segment area
-        pygame.draw.rect(surface, bg_color, (x, y, actual_width, height))
-
         filled_segments = int((percent / 100) * num_segments)
         # Show at least 1 segment if percent > 0
         if percent > 0 and filled_segments == 0:
             filled_segments = 1
+        filled_segments = min(filled_segments, num_segments)
 
-        for i in range(num_segments):
-            seg_x = x + i * total_segment_size
-            if i < filled_segments:
-                pygame.draw.rect(
-                    surface, color, (seg_x, y + 2, segment_width, height - 4)
-                )
-            else:
+        # Unlit bar, then the lit segments copied over it as one strip
+        unlit = self._chunky_strip(actual_width, height, bg_color, colors.DARKER_GRAY())
+        surface.blit(unlit, (x, y))
+        if filled_segments:
+            filled_width = filled_segments * total_segment_size - segment_gap
+            lit = self._chunky_strip(actual_width, height, bg_color, color)
+            surface.blit(lit, (x, y), (0, 0, filled_width, height))
+
+    def _chunky_strip(
+        self,
+        width: int,
+        height: int,
+        bg_color: tuple[int, int, int],
+        segment_color: tuple[int, int, int],
+    ) -> pygame.Surface:
+        """A whole chunky bar with every segment in segment_color, drawn once"""
+        key = (width, height, bg_color, segment_color)
+        strip = self._chunky_strips.get(key)
+        if strip is None:
+            # Background matches actual segment area
+            strip = pygame.Surface((max(width, 0), height)).convert()
+            strip.fill(bg_color)
+            step = self._SEGMENT_WIDTH + self._SEGMENT_GAP
+            for seg_x in range(0, width, step):
                 pygame.draw.rect(
-                    surface,
-                    colors.DARKER_GRAY(),
-                    (seg_x, y + 2, segment_width, height - 4),
+                    strip, segment_color, (seg_x, 2, self._SEGMENT_WIDTH, height - 4)
                 )
+            self._chunky_strips[key] = strip
+        return strip
 
     def draw_dashed_bar(
         self,
@@ -462,11 +490,18 @@ class UIComponents:
 
     def draw_scanlines(self, surface: pygame.Surface, alpha: int = 60) -> None:
         """Draw CRT-style scanlines effect"""
-        scanline_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        for y in range(0, surface.get_height(), 3):
-            pygame.draw.line(
-                scanline_surface, (0, 0, 0, alpha), (0, y), (surface.get_width(), y)
-            )
+        key = (surface.get_size(), alpha)
+        scanline_surface = self._scanlines.get(key)
+        if scanline_surface is None:
+            # The pattern is static, so draw it once and reuse it every frame;
+            # converting to the display format keeps the per-frame blit cheap
+            scanline_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            scanline_surface = scanline_surface.convert_alpha()
+            for y in range(0, surface.get_height(), 3):
+                pygame.draw.line(
+                    scanline_surface, (0, 0, 0, alpha), (0, y), (surface.get_width(), y)
+                )
+            self._scanlines[key] = scanline_surface
         surface.blit(scanline_surface, (0, 0))
 
     def draw_screen_indicators(
@@ -479,15 +514,25 @@ class UIComponents:
         """Draw screen position indicators"""
         if y is None:
             y = SCREEN_HEIGHT - 10
-        indicator_width = 8
-        indicator_spacing = 12
-        total_width = total * indicator_spacing - (indicator_spacing - indicator_width)
-        start_x = (surface.get_width() - total_width) // 2
-
-        for i in range(total):
-            color = colors.WHITE() if i == current else colors.DARK_GRAY()
-            pygame.draw.rect(
-                surface,
-                color,
-                (start_x + i * indicator_spacing, y, indicator_width, indicator_width),
+        key = (surface.get_width(), total, y)
+        rects = self._indicator_rects.get(key)
+        if rects is None:
+            # Positions depend only on the key, so lay them out once
+            indicator_width = 8
+            indicator_spacing = 12
+            total_width = total * indicator_spacing - (
+                indicator_spacing - indicator_width
             )
+            start_x = (key[0] - total_width) // 2
+            rects = [
+                pygame.Rect(
+                    start_x + i * indicator_spacing, y, indicator_width, indicator_width
+                )
+                for i in range(total)
+            ]
+            self._indicator_rects[key] = rects
+
+        active = colors.WHITE()
+        inactive = colors.DARK_GRAY()
+        for i, rect in enumerate(rects):
+            pygame.draw.rect(surface, active if i == current else inactive, rect)
@@ -1,10 +1,11 @@
 """Pixel art font management"""
 
 import os
+from collections import OrderedDict
 
 import pygame
 
-from config import Layout
+from config import layout
 from utils.logger import logger
 
 
@@ -15,7 +16,7 @@ def _scale_font_size(base_size: int) -> int:
     Ensures minimum readable sizes.
     """
     # Use scale_min to ensure fonts fit in both dimensions
-    scaled = int(base_size * Layout.scale_min)
+    scaled = int(base_size * layout.scale_min)
     # Ensure minimum readable sizes
     if base_size >= 14:  # large
         return max(10, scaled)
@@ -30,6 +31,9 @@ def _scale_font_size(base_size: int) -> int:
 class PixelFont:
     """Pixel art font renderer using Press Start 2P"""
 
+    # Rendered texts kept by render_cached; least recently used go first
+    _MAX_RENDERED = 256
+
     def __init__(self) -> None:
         pygame.font.init()
         pixel_font = os.path.expanduser("~/.fonts/PressStart2P.ttf")
@@ -49,8 +53,12 @@ class PixelFont:
         tiny_fallback = _scale_font_size(8)
 
         logger.info(
-            f"Font sizes (scale={Layout.scale_min:.2f}): "
-            f"large={large_size}, medium={medium_size}, small={small_size}, tiny={tiny_size}"
+            "Font sizes (scale=%.2f): large=%s, medium=%s, small=%s, tiny=%s",
+            layout.scale_min,
+            large_size,
+            medium_size,
+            small_size,
+            tiny_size,
         )
 
         try:
@@ -60,14 +68,60 @@ class PixelFont:
                 self.small = pygame.font.Font(pixel_font, small_size)
                 self.tiny = pygame.font.Font(pixel_font, tiny_size)
             else:
-                logger.warning(f"Pixel font not found at {pixel_font}, using fallback")
+                logger.warning("Pixel font not found at %s, using fallback", pixel_font)
                 self.large = pygame.font.Font(fallback, large_fallback)
                 self.medium = pygame.font.Font(fallback, medium_fallback)
                 self.small = pygame.font.Font(fallback, small_fallback)
                 self.tiny = pygame.font.Font(fallback, tiny_fallback)
         except Exception as e:
-            logger.error(f"Error loading fonts: {e}")
+            logger.error("Error loading fonts: %s", e)
             self.large = pygame.font.SysFont("monospace", large_fallback, bold=True)
             self.medium = pygame.font.SysFont("monospace", medium_fallback, bold=True)
             self.small = pygame.font.SysFont("monospace", small_fallback, bold=True)
             self.tiny = pygame.font.SysFont("monospace", tiny_fallback, bold=True)
+
+        # Rendered texts keyed by (font, text, color), in least recent use order
+        self._rendered: OrderedDict[
+            tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface
+        ] = OrderedDict()
+
+    def render_cached(
+        self, font: pygame.font.Font, text: str, color: tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Render text once and reuse the surface while it stays in use.
+
+        Meant for labels, titles and values that change rarely; the cache is
+        bounded, so text that changes every frame only churns it.
+        """
+        key = (font, text, color)
+        surface = self._rendered.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._rendered[key] = surface
+            if len(self._rendered) > self._MAX_RENDERED:
+                self._rendered.popitem(last=False)
+        else:
+            self._rendered.move_to_end(key)
+        return surface
+
+    def blit_glyphs(
+        self,
+        surface: pygame.Surface,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+        pos: tuple[int, int],
+    ) -> None:
+        """Blit text one cached glyph at a time instead of rasterizing it.
+
+        For text that changes often but uses few characters, like animated
+        counters; every font loaded here is monospaced, so the result matches
+        render().
+        """
+        x, y = pos
+        glyphs = []
+        for char in text:
+            glyph = self.render_cached(font, char, color)
+            glyphs.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(glyphs, doreturn=False)
@@ -320,7 +320,7 @@ def get_theme(name: str | None = None) -> Theme:
         name = os.environ.get("CUTIE_THEME", "default")
 
     if name not in THEMES:
-        logger.warning(f"Unknown theme '{name}', using default")
+        logger.warning("Unknown theme '%s', using default", name)
         name = "default"
 
     return THEMES[name]
@@ -1,3 +1,4 @@
 """Utilities package"""
 
 from .system_info import SystemInfo as SystemInfo
+from .system_info import get_local_ip as get_local_ip
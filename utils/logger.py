@@ -1,8 +1,28 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 
-# Configure logger
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+# Records are queued by the caller and written out by a listener thread,
+# so slow log I/O never blocks the render loop
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+# The queue handler only merges args into the message; the listener's
+# handler applies the full format
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+# Configure logger
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
+
+# urllib3 logs every redirect it follows at INFO, which would repeat on each
+# poll of a Pi-hole URL that redirects
+logging.getLogger("urllib3").setLevel(logging.WARNING)
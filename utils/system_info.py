@@ -1,8 +1,33 @@
 """System information gathering utilities"""
 
-import subprocess
+import shutil
+import socket
+import threading
 import time
-from venv import logger
+
+from utils.logger import logger
+
+
+def get_local_ip() -> str:
+    """Get the device's primary IP address without spawning a process.
+
+    Connecting a UDP socket sends no packets; it only makes the kernel pick
+    the outbound interface, whose address getsockname() then reports. That
+    is cheap enough to redo on every call, so DHCP renewals and interface
+    changes show up on the next refresh.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return str(s.getsockname()[0])
+    except OSError:
+        return "N/A"
+
+
+def _meminfo_kb(meminfo: bytes, field: bytes) -> int:
+    """Value in kB of one /proc/meminfo field, or 0 if it is missing"""
+    _, found, rest = meminfo.partition(field)
+    return int(rest.split(maxsplit=1)[0]) if found else 0
 
 
 class SystemInfo:
@@ -22,15 +47,33 @@ class SystemInfo:
         self.hostname = ""
         self.fan_speed = 0
         self.fan_rpm = 0
-        self.last_update = 0.0
+        self.last_update = float("-inf")  # time.monotonic() of the last fetch
         self._last_cpu: tuple[int, int] | None = None
+        # Fetching runs on a background thread, paced by calls to update()
+        self._wanted = threading.Event()
+        self._poller: threading.Thread | None = None
 
     def update(self, interval: float = 2.0) -> None:
-        """Update system info if enough time has passed"""
-        current_time = time.time()
-        if current_time - self.last_update > interval:
+        """Keep system info refreshed every interval seconds while called.
+
+        The files are read on a background thread so callers never block on
+        them; the attributes change once a fetch completes.
+        """
+        if self._poller is None:
+            self._poller = threading.Thread(
+                target=self._poll, args=(interval,), daemon=True, name="sysinfo"
+            )
+            self._poller.start()
+        self._wanted.set()
+
+    def _poll(self, interval: float) -> None:
+        """Fetch whenever update() asked for it, at most every interval seconds"""
+        while True:
+            self._wanted.wait()
+            self._wanted.clear()
             self._fetch_all()
-            self.last_update = current_time
+            self.last_update = time.monotonic()
+            time.sleep(interval)
 
     def _fetch_all(self) -> None:
         """Fetch all system information"""
@@ -43,12 +86,12 @@ class SystemInfo:
             self._fetch_network()
             self._fetch_fan()
         except Exception as e:
-            logger.error(f"Error getting system info: {e}")
+            logger.error("Error getting system info: %s", e)
 
     def _fetch_cpu(self) -> None:
         """Fetch CPU usage from /proc/stat"""
         try:
-            with open("/proc/stat") as f:
+            with open("/proc/stat", "rb") as f:
                 cpu_line = f.readline()
                 cpu_times = list(map(int, cpu_line.split()[1:]))
                 idle = cpu_times[3]
@@ -60,62 +103,48 @@ class SystemInfo:
                         self.cpu_percent = 100 * (1 - idle_delta / total_delta)
                 self._last_cpu = (idle, total)
         except Exception as e:
-            logger.error(f"Error getting CPU: {e}")
+            logger.error("Error getting CPU: %s", e)
 
     def _fetch_memory(self) -> None:
         """Fetch memory usage from /proc/meminfo"""
         try:
-            with open("/proc/meminfo") as f:
-                meminfo: dict[str, int] = {}
-                for line in f:
-                    parts = line.split()
-                    meminfo[parts[0].rstrip(":")] = int(parts[1])
-                self.mem_total = meminfo.get("MemTotal", 0) / 1024  # MB
-                mem_available = meminfo.get("MemAvailable", 0) / 1024
-                self.mem_used = self.mem_total - mem_available
-                self.mem_percent = (
-                    (self.mem_used / self.mem_total * 100) if self.mem_total > 0 else 0
-                )
+            with open("/proc/meminfo", "rb") as f:
+                meminfo = f.read()
+            self.mem_total = _meminfo_kb(meminfo, b"MemTotal:") / 1024  # MB
+            mem_available = _meminfo_kb(meminfo, b"MemAvailable:") / 1024
+            self.mem_used = self.mem_total - mem_available
+            self.mem_percent = (
+                (self.mem_used / self.mem_total * 100) if self.mem_total > 0 else 0
+            )
         except Exception as e:
-            logger.error(f"Error getting memory: {e}")
+            logger.error("Error getting memory: %s", e)
 
     def _fetch_disk(self) -> None:
-        """Fetch disk usage"""
+        """Fetch disk usage of the root filesystem (statvfs, no df process)"""
         try:
-            result = subprocess.run(
-                ["df", "-B1", "/"],
-                capture_output=True,
-                text=True,
-                timeout=2,
+            total, used, _ = shutil.disk_usage("/")
+            self.disk_total = total / (1024**3)  # GB
+            self.disk_used = used / (1024**3)
+            self.disk_percent = (
+                (self.disk_used / self.disk_total * 100) if self.disk_total > 0 else 0
             )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                if len(lines) >= 2:
-                    parts = lines[1].split()
-                    self.disk_total = int(parts[1]) / (1024**3)  # GB
-                    self.disk_used = int(parts[2]) / (1024**3)
-                    self.disk_percent = (
-                        (self.disk_used / self.disk_total * 100)
-                        if self.disk_total > 0
-                        else 0
-                    )
         except Exception as e:
-            logger.error(f"Error getting disk: {e}")
+            logger.error("Error getting disk: %s", e)
 
     def _fetch_temperature(self) -> None:
         """Fetch CPU temperature"""
         try:
-            with open("/sys/class/thermal/thermal_zone0/temp") as f:
-                self.temp = int(f.read().strip()) / 1000
+            with open("/sys/class/thermal/thermal_zone0/temp", "rb") as f:
+                self.temp = int(f.read()) / 1000
         except Exception as e:
-            logger.error(f"Error getting temperature: {e}")
+            logger.error("Error getting temperature: %s", e)
             self.temp = 0
 
     def _fetch_uptime(self) -> None:
         """Fetch system uptime"""
         try:
-            with open("/proc/uptime") as f:
-                uptime_secs = float(f.read().split()[0])
+            with open("/proc/uptime", "rb") as f:
+                uptime_secs = float(f.read().split(maxsplit=1)[0])
                 days = int(uptime_secs // 86400)
                 hours = int((uptime_secs % 86400) // 3600)
                 mins = int((uptime_secs % 3600) // 60)
@@ -124,31 +153,15 @@ class SystemInfo:
                 else:
                     self.uptime = f"{hours}h {mins}m"
         except Exception as e:
-            logger.error(f"Error getting uptime: {e}")
+            logger.error("Error getting uptime: %s", e)
             self.uptime = "N/A"
 
     def _fetch_network(self) -> None:
         """Fetch IP address and hostname"""
-        try:
-            result = subprocess.run(
-                ["hostname", "-I"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            self.ip_address = (
-                result.stdout.strip().split()[0] if result.stdout.strip() else "N/A"
-            )
-        except Exception as e:
-            logger.error(f"Error getting IP address: {e}")
-            self.ip_address = "N/A"
-
-        try:
-            with open("/etc/hostname") as f:
-                self.hostname = f.read().strip()
-        except Exception as e:
-            logger.error(f"Error getting hostname: {e}")
-            self.hostname = "unknown"
+        # Resolved afresh on each refresh so address changes show up
+        self.ip_address = get_local_ip()
+        # Same value as /etc/hostname, straight from the kernel (uname)
+        self.hostname = socket.gethostname() or "unknown"
 
     def _fetch_fan(self) -> None:
         """Fetch fan speed (RPM) for Pi 5"""